@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+# builder/artifact_cache.py
+"""
+Content-addressed local cache for export outputs.
+
+Exported artifacts are stored under a hash of everything that goes into the
+build: the bundled sources and data files, the PyInstaller options, and the
+Python, PyInstaller and bundled third-party package versions. Paths are
+normalised relative to the project, so the same deck exported from two
+checkouts on one machine hits the same entry. PyInstaller's work directory
+(its analysis results) is also kept in the cache, keyed by the build options
+and the checkout, so a changed deck reuses the previous analysis instead of
+starting from scratch. Index updates are serialised with a lock file so
+concurrent exports do not lose each other's entries.
+
+The cache lives in ~/.nachocore/cache by default (override with the
+NACHOCORE_CACHE_DIR environment variable or ARTIFACT_CACHE_DIR in config.json)
+and is capped by ARTIFACT_CACHE_MAX_MB, evicting least-recently-used entries.
+
+Command line:
+    python -m builder.artifact_cache list
+    python -m builder.artifact_cache prune [--max-mb N | --all]
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import hashlib
+import platform
+import tempfile
+from contextlib import contextmanager
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from shared.utils import logger
+
+CONFIG_PATH = os.path.join(PROJECT_ROOT, "builder", "config.json")
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".nachocore", "cache")
+DEFAULT_MAX_MB = 2048
+
+# Sources that end up inside the bundle, relative to the project root.
+BUNDLED_SOURCE_DIRS = ("game", "shared")
+BUNDLED_SOURCE_FILES = ("builder/__init__.py", "builder/static_manifest.py", "builder/static_resources.py")
+SOURCE_EXTENSIONS = (".py", ".json", ".qss")
+
+# Third-party distributions the game bundles; their own requirements are
+# followed, so e.g. urllib3 and certifi are covered through requests.
+BUNDLED_DISTRIBUTIONS = ("PyQt6", "requests", "pynput", "psutil", "pywin32")
+
+# An index lock older than this is assumed to belong to a crashed export.
+STALE_LOCK_SECONDS = 60
+INDEX_LOCK_TIMEOUT = 10
+
+
+def _load_config():
+    try:
+        with open(CONFIG_PATH, "r") as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+
+def get_cache_root():
+    return (os.environ.get("NACHOCORE_CACHE_DIR")
+            or _load_config().get("ARTIFACT_CACHE_DIR")
+            or DEFAULT_CACHE_DIR)
+
+
+def get_max_bytes():
+    value = os.environ.get("NACHOCORE_CACHE_MAX_MB") or _load_config().get("ARTIFACT_CACHE_MAX_MB", DEFAULT_MAX_MB)
+    try:
+        return int(float(value) * 1024 * 1024)
+    except (TypeError, ValueError):
+        return DEFAULT_MAX_MB * 1024 * 1024
+
+
+def pyinstaller_version():
+    try:
+        from importlib.metadata import version
+        return version("pyinstaller")
+    except Exception:
+        return "unknown"
+
+
+def remove_path(path):
+    """Removes a file or a folder at path, if anything is there."""
+    if os.path.isdir(path) and not os.path.islink(path):
+        shutil.rmtree(path)
+    elif os.path.lexists(path):
+        os.remove(path)
+
+
+def distribution_versions(names=BUNDLED_DISTRIBUTIONS):
+    """
+    Returns {distribution: version} for names and everything they require,
+    with "missing" for distributions that are not installed here.
+    """
+    import re
+    from importlib import metadata
+    versions = {}
+    pending = list(names)
+    while pending:
+        name = pending.pop()
+        key = re.sub(r"[-_.]+", "-", name).lower()
+        if key in versions:
+            continue
+        try:
+            dist = metadata.distribution(name)
+        except metadata.PackageNotFoundError:
+            versions[key] = "missing"
+            continue
+        versions[key] = dist.version
+        for requirement in dist.requires or ():
+            if "extra ==" in requirement:
+                continue
+            match = re.match(r"[A-Za-z0-9][A-Za-z0-9._-]*", requirement)
+            if match:
+                pending.append(match.group(0))
+    return versions
+
+
+def path_size(path):
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    total = 0
+    for root, _, files in os.walk(path):
+        for f in files:
+            try:
+                total += os.path.getsize(os.path.join(root, f))
+            except OSError:
+                pass
+    return total
+
+
+def collect_bundle_inputs(project_root, data_files):
+    """
+    Returns the sorted list of absolute paths whose contents determine the
+    exported artifact: bundled sources plus every --add-data file.
+    """
+    paths = set()
+    for rel in BUNDLED_SOURCE_DIRS:
+        for root, dirnames, files in os.walk(os.path.join(project_root, rel)):
+            dirnames[:] = [d for d in dirnames if d != "__pycache__"]
+            for f in files:
+                if f.endswith(SOURCE_EXTENSIONS):
+                    paths.add(os.path.join(root, f))
+    for rel in BUNDLED_SOURCE_FILES:
+        path = os.path.join(project_root, rel)
+        if os.path.exists(path):
+            paths.add(path)
+    for df in data_files:
+        paths.add(df.split(";", 1)[0])
+    return sorted(paths)
+
+
+def normalize_options(options, project_root):
+    """Makes PyInstaller options independent of where the project is checked out."""
+    root = os.path.abspath(project_root)
+    return [str(opt).replace(root, "<root>").replace("\\", "/") for opt in options]
+
+
+def compute_key(input_paths, options, project_root, scope=""):
+    """
+    Hashes file contents (by project-relative path), build options and the
+    installed versions of the bundled packages. scope is hashed as given, to
+    keep keys apart that would otherwise match (e.g. per checkout).
+    """
+    h = hashlib.sha256()
+    h.update(f"python={platform.python_version()};pyinstaller={pyinstaller_version()};"
+             f"platform={sys.platform};scope={scope}\n".encode("utf-8"))
+    h.update(json.dumps(sorted(distribution_versions().items())).encode("utf-8"))
+    h.update(json.dumps(normalize_options(options, project_root)).encode("utf-8"))
+    for path in input_paths:
+        rel = os.path.relpath(path, project_root).replace("\\", "/")
+        h.update(b"\0" + rel.encode("utf-8") + b"\0")
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+    return h.hexdigest()
+
+
+class ArtifactCache:
+    def __init__(self, root=None, max_bytes=None):
+        self.root = root or get_cache_root()
+        self.max_bytes = get_max_bytes() if max_bytes is None else max_bytes
+        self.index_path = os.path.join(self.root, "index.json")
+
+    # -------------- Index --------------
+    def _load_index(self):
+        try:
+            with open(self.index_path, "r") as f:
+                return json.load(f)
+        except Exception:
+            return {}
+
+    def _save_index(self, index):
+        os.makedirs(self.root, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(index, f, indent=2)
+        os.replace(tmp, self.index_path)
+
+    @contextmanager
+    def _locked_index(self):
+        """Yields the index for a read-modify-write and saves it afterwards, under a lock file."""
+        os.makedirs(self.root, exist_ok=True)
+        lock_path = self.index_path + ".lock"
+        deadline = time.time() + INDEX_LOCK_TIMEOUT
+        locked = False
+        while not locked:
+            try:
+                os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                locked = True
+            except FileExistsError:
+                try:
+                    if time.time() - os.path.getmtime(lock_path) > STALE_LOCK_SECONDS:
+                        os.remove(lock_path)
+                        continue
+                except OSError:
+                    continue
+                if time.time() > deadline:
+                    logger.warning("Artifact cache index is locked; updating it without the lock")
+                    break
+                time.sleep(0.05)
+        try:
+            index = self._load_index()
+            yield index
+            self._save_index(index)
+        finally:
+            if locked:
+                try:
+                    os.remove(lock_path)
+                except OSError:
+                    pass
+
+    def _entry_path(self, entry_id):
+        kind, key = entry_id.split("/", 1)
+        return os.path.join(self.root, kind, key)
+
+    def _touch(self, entry_id, **fields):
+        with self._locked_index() as index:
+            entry = index.setdefault(entry_id, {"created": time.time()})
+            entry.update(fields)
+            entry["last_used"] = time.time()
+        return entry
+
+    # -------------- Artifacts --------------
+    # Artifacts are stored under a fixed name. The export name is not part of
+    # a one-file key, so one build serves every name it is exported under;
+    # one-folder bundles contain <name>.exe, so export_exe() keys those by name.
+    ARTIFACT_NAME = "artifact"
+
+    def lookup(self, key):
+        """Returns the cached artifact path for key, or None on a miss."""
+        entry_id = f"artifacts/{key}"
+        path = os.path.join(self._entry_path(entry_id), self.ARTIFACT_NAME)
+        if not os.path.exists(path):
+            return None
+        self._touch(entry_id)
+        return path
+
+    def restore(self, key, destination):
+        """Copies a cached artifact to destination. Returns True on a hit."""
+        cached = self.lookup(key)
+        if cached is None:
+            return False
+        remove_path(destination)
+        if os.path.isdir(cached):
+            shutil.copytree(cached, destination)
+        else:
+            shutil.copy2(cached, destination)
+        return True
+
+    def store(self, key, source, label=""):
+        """Copies a freshly built artifact (file or folder) into the cache."""
+        entry_id = f"artifacts/{key}"
+        entry_dir = self._entry_path(entry_id)
+        target = os.path.join(entry_dir, self.ARTIFACT_NAME)
+        try:
+            if os.path.exists(entry_dir):
+                shutil.rmtree(entry_dir)
+            os.makedirs(entry_dir)
+            if os.path.isdir(source):
+                shutil.copytree(source, target)
+            else:
+                shutil.copy2(source, target)
+        except Exception as e:
+            logger.error("Error storing artifact in cache: %s", e)
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            return
+        self._touch(entry_id, size=path_size(entry_dir), label=label)
+        self.evict()
+
+    # -------------- PyInstaller work directories --------------
+    def work_dir(self, key, label=""):
+        """Returns (and reserves) a persistent PyInstaller work directory for key."""
+        entry_id = f"work/{key}"
+        path = self._entry_path(entry_id)
+        os.makedirs(path, exist_ok=True)
+        self._touch(entry_id, label=label)
+        return path
+
+    def record_work(self, key):
+        """Updates the recorded size of a work directory after a build."""
+        entry_id = f"work/{key}"
+        self._touch(entry_id, size=path_size(self._entry_path(entry_id)))
+        self.evict()
+
+    # -------------- Maintenance --------------
+    def entries(self):
+        """Returns [(entry_id, entry)] sorted by last use, most recent first."""
+        index = self._load_index()
+        return sorted(index.items(), key=lambda item: item[1].get("last_used", 0), reverse=True)
+
+    def total_size(self):
+        return sum(entry.get("size", 0) for _, entry in self.entries())
+
+    def remove(self, entry_id):
+        shutil.rmtree(self._entry_path(entry_id), ignore_errors=True)
+        with self._locked_index() as index:
+            index.pop(entry_id, None)
+
+    def evict(self, max_bytes=None):
+        """Removes least-recently-used entries until the cache fits max_bytes."""
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        removed = []
+        with self._locked_index() as index:
+            total = sum(entry.get("size", 0) for entry in index.values())
+            for entry_id, entry in sorted(index.items(), key=lambda item: item[1].get("last_used", 0)):
+                if total <= limit:
+                    break
+                shutil.rmtree(self._entry_path(entry_id), ignore_errors=True)
+                total -= entry.get("size", 0)
+                del index[entry_id]
+                removed.append(entry_id)
+        if removed:
+            logger.info("Artifact cache evicted %d entries", len(removed))
+        return removed
+
+
+def _format_entry(entry_id, entry):
+    from builder.export_history import format_size
+    used = time.strftime("%Y-%m-%d %H:%M", time.localtime(entry.get("last_used", 0)))
+    return f"{used}  {format_size(entry.get('size', 0)):>10}  {entry_id[:24]}  {entry.get('label', '')}"
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="List and prune the local export artifact cache.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("list", help="List cache entries, most recently used first")
+    prune = sub.add_parser("prune", help="Evict least-recently-used entries")
+    prune.add_argument("--max-mb", type=float, help="Target size in MB (default: configured limit)")
+    prune.add_argument("--all", action="store_true", help="Remove every entry")
+    args = parser.parse_args()
+
+    cache = ArtifactCache()
+    if args.command == "list":
+        from builder.export_history import format_size
+        print(f"Cache: {cache.root}")
+        for entry_id, entry in cache.entries():
+            print(_format_entry(entry_id, entry))
+        print(f"Total: {format_size(cache.total_size())} of {format_size(cache.max_bytes)}")
+    elif args.all:
+        entries = cache.entries()
+        for entry_id, _ in entries:
+            cache.remove(entry_id)
+        print(f"Removed {len(entries)} entries.")
+    else:
+        limit = int(args.max_mb * 1024 * 1024) if args.max_mb is not None else None
+        removed = cache.evict(limit)
+        print(f"Removed {len(removed)} entries.")
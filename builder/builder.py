@@ -1,21 +1,29 @@
 import os
 import sys
+import copy
 import json
-import glob
 import importlib.util
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QTabWidget, QWidget,
     QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QComboBox, QLineEdit, QFormLayout, QGroupBox, QListWidget,
-    QListWidgetItem, QMessageBox, QCheckBox, QDialog, QPlainTextEdit, QSlider
+    QListWidgetItem, QMessageBox, QCheckBox, QDialog, QPlainTextEdit, QSlider,
+    QInputDialog, QDialogButtonBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot
+from PyQt6.QtCore import Qt, pyqtSlot
 
 # Determine project root (assuming builder.py is in the builder folder)
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
+# Write bytecode to a persistent cache outside the source tree (see
+# builder/cleanup.py). Set before any project module is imported so none of
+# them compile into the tree; kept in sync with shared/utils/pycache.py.
+if sys.pycache_prefix is None:
+    sys.pycache_prefix = (os.environ.get("NACHOCORE_PYCACHE_DIR")
+                          or os.path.join(os.path.expanduser("~"), ".nachocore", "pycache"))
+
 from shared.theme.theme import load_stylesheet
 
 # File path for configuration.
@@ -28,7 +36,12 @@ from builder.task_builder import TaskManager, TaskListWidget
 # Import centralized security_settings module.
 from builder import security_settings
 
-from builder.cleanup import clean_pycache
+from builder.validation import validate_tasks, format_problems, invalidate as invalidate_validator
+from builder.task_watcher import TaskModuleWatcher
+from shared.utils import logger
+from builder.preview import GamePreview
+from builder.profiling import timed
+from shared.utils.task_discovery import scan_task_modules
 
 # ---------------- Security Mode Mappings ----------------
 SECURITY_MODES = {
@@ -62,6 +75,7 @@ def discover_task_modules():
     """
     Scans the shared/tasks folder for .py files (excluding __init__.py)
     and returns a dictionary mapping normalized TASK_TYPE -> module import path.
+    Task modules are not imported until their form is first opened.
     If running frozen, returns a static manifest.
     """
     if getattr(sys, "frozen", False):
@@ -71,23 +85,7 @@ def discover_task_modules():
             "name_collection": "shared.tasks.name_collection",
             "short_answer": "shared.tasks.short_answer"
         }
-    task_modules = {}
-    tasks_folder = os.path.join(PROJECT_ROOT, "shared", "tasks")
-    for filepath in glob.glob(os.path.join(tasks_folder, "*.py")):
-        filename = os.path.basename(filepath)
-        if filename == "__init__.py":
-            continue
-        module_name = os.path.splitext(filename)[0]
-        spec = importlib.util.spec_from_file_location(module_name, filepath)
-        module = importlib.util.module_from_spec(spec)
-        try:
-            spec.loader.exec_module(module)
-            if hasattr(module, "TASK_TYPE"):
-                normalized = normalize_task_type(module.TASK_TYPE)
-                task_modules[normalized] = f"shared.tasks.{module_name}"
-        except Exception as e:
-            print(f"Error importing {filename}: {e}")
-    return task_modules
+    return scan_task_modules(os.path.join(PROJECT_ROOT, "shared", "tasks"))
 
 # ---------------- Persistent Security Header ----------------
 class SecurityHeader(QWidget):
@@ -104,96 +102,41 @@ class SecurityHeader(QWidget):
         self.modeLabel.setText(f"Security Mode: {mode}")
         self.modeLabel.setStyleSheet(f"color: {color}; font-weight: bold;")
 
-# ---------------- Developer Zone Tab ----------------
-class DevZoneWidget(QWidget):
-    modeChanged = pyqtSignal(str)
-    def __init__(self, parent=None):
+# ---------------- Task Form Defaults ----------------
+def reset_task_fields(task_inst):
+    """
+    Restores a cached builder form's schema fields to a fresh Task's defaults,
+    so optional keys missing from the next task do not keep the last task's values.
+    """
+    schema = getattr(sys.modules.get(type(task_inst).__module__), "TASK_SCHEMA", {})
+    fresh = type(task_inst)()
+    for field in schema:
+        if hasattr(fresh, field):
+            setattr(task_inst, field, copy.deepcopy(getattr(fresh, field)))
+
+# ---------------- Find/Replace Dialog ----------------
+class FindReplaceDialog(QDialog):
+    def __init__(self, has_selection=False, parent=None):
         super().__init__(parent)
-        self.init_ui()
-        self.load_existing_state()
-    def init_ui(self):
-        layout = QVBoxLayout(self)
-        row = QHBoxLayout()
-        row.addWidget(QLabel("Set Security Mode:"))
-        self.modeSlider = QSlider(Qt.Orientation.Horizontal)
-        self.modeSlider.setRange(0, 3)
-        self.modeSlider.setTickInterval(1)
-        self.modeSlider.setTickPosition(QSlider.TickPosition.TicksBelow)
-        self.modeSlider.setSingleStep(1)
-        self.modeSlider.valueChanged.connect(self.on_slider_changed)
-        row.addWidget(self.modeSlider)
-        self.modeDisplay = QLabel(SECURITY_MODES[0])
-        row.addWidget(self.modeDisplay)
-        layout.addLayout(row)
-        self.summaryLabel = QLabel("")
-        self.summaryLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.addWidget(self.summaryLabel)
-        self.customContainer = QWidget()
-        form = QFormLayout(self.customContainer)
-        self.custom_uiKeyboard = QCheckBox("Use UI Keyboard")
-        self.custom_keyboard_blocker = QComboBox()
-        self.custom_keyboard_blocker.addItem("Block All (Mode 1)", 1)
-        self.custom_keyboard_blocker.addItem("Allow Typeable (Mode 2)", 2)
-        self.custom_mouse_locker = QCheckBox("Enable Mouse Locker")
-        self.custom_sleep_blocker = QCheckBox("Enable Sleep Blocker")
-        self.custom_security_monitor = QCheckBox("Enable Security Monitor")
-        form.addRow(self.custom_uiKeyboard)
-        form.addRow("Keyboard Blocker Mode:", self.custom_keyboard_blocker)
-        form.addRow(self.custom_mouse_locker)
-        form.addRow(self.custom_sleep_blocker)
-        form.addRow(self.custom_security_monitor)
-        self.customContainer.setVisible(False)
-        layout.addWidget(self.customContainer)
-        self.saveButton = QPushButton("Apply Security Mode")
-        self.saveButton.clicked.connect(self.save_mode)
-        layout.addWidget(self.saveButton)
-    @pyqtSlot(int)
-    def on_slider_changed(self, value):
-        mode = SECURITY_MODES.get(value, "Ethical")
-        self.modeDisplay.setText(mode)
-        if mode == "Custom":
-            self.customContainer.setVisible(True)
-            self.summaryLabel.setText("")
-        else:
-            self.customContainer.setVisible(False)
-            self.summaryLabel.setText(generate_security_summary(mode))
-        self.modeChanged.emit(mode)
-    def load_existing_state(self):
-        config = security_settings.load_security_settings()
-        mode = config.get("SECURITY_MODE", "Ethical")
-        slider_val = list(SECURITY_MODES.values()).index(mode) if mode in SECURITY_MODES.values() else 0
-        self.modeSlider.setValue(slider_val)
-        if mode == "Custom":
-            self.custom_uiKeyboard.setChecked(config.get("USE_UI_KEYBOARD", False))
-            kb_mode = config.get("KEYBOARD_BLOCKER_MODE", 1)
-            self.custom_keyboard_blocker.setCurrentIndex(0 if kb_mode == 1 else 1)
-            self.custom_mouse_locker.setChecked(config.get("ENABLE_MOUSE_LOCKER", False))
-            self.custom_sleep_blocker.setChecked(config.get("ENABLE_SLEEP_BLOCKER", False))
-            self.custom_security_monitor.setChecked(config.get("ENABLE_SECURITY_MONITOR", False))
-        else:
-            self.summaryLabel.setText(generate_security_summary(mode))
-    def save_mode(self):
-        mode = SECURITY_MODES.get(self.modeSlider.value(), "Ethical")
-        if mode == "Custom":
-            custom_settings = {
-                "USE_UI_KEYBOARD": self.custom_uiKeyboard.isChecked(),
-                "KEYBOARD_BLOCKER_MODE": self.custom_keyboard_blocker.currentData(),
-                "ENABLE_MOUSE_LOCKER": self.custom_mouse_locker.isChecked(),
-                "ENABLE_SLEEP_BLOCKER": self.custom_sleep_blocker.isChecked(),
-                "ENABLE_SECURITY_MONITOR": self.custom_security_monitor.isChecked(),
-                "SECURITY_MODE": mode
-            }
-            success, message, _ = security_settings.set_mode(mode, custom_settings=custom_settings)
-        else:
-            success, message, _ = security_settings.set_mode(mode)
-            config = security_settings.load_security_settings()
-            config["SECURITY_MODE"] = mode
-            security_settings.save_security_settings(config)
-        if success:
-            QMessageBox.information(self, "Success", f"Security mode set to {mode}.")
-            self.modeChanged.emit(mode)
-        else:
-            QMessageBox.critical(self, "Error", message)
+        self.setWindowTitle("Find and Replace in Questions")
+        form = QFormLayout(self)
+        self.find_edit = QLineEdit()
+        self.replace_edit = QLineEdit()
+        self.selected_only = QCheckBox("Selected tasks only")
+        self.selected_only.setChecked(has_selection)
+        self.selected_only.setEnabled(has_selection)
+        self.match_case = QCheckBox("Match case")
+        form.addRow("Find:", self.find_edit)
+        form.addRow("Replace with:", self.replace_edit)
+        form.addRow(self.selected_only)
+        form.addRow(self.match_case)
+        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        form.addRow(buttons)
+    def values(self):
+        return (self.find_edit.text(), self.replace_edit.text(),
+                self.selected_only.isChecked(), self.match_case.isChecked())
 
 # ---------------- Main Builder UI ----------------
 class BuilderUI(QMainWindow):
@@ -208,7 +151,8 @@ class BuilderUI(QMainWindow):
         main_layout.addWidget(self.header)
         self.tabs = QTabWidget()
         main_layout.addWidget(self.tabs, 1)
-        self.discovered_tasks = discover_task_modules()
+        with timed("task_discovery"):
+            self.discovered_tasks = discover_task_modules()
         self.tabs.addTab(self.create_task_tab(), "Task Builder")
         self.tabs.addTab(self.create_gift_card_tab(), "Gift Card Selection")
         self.tabs.addTab(self.create_export_tab(), "Export Options")
@@ -217,6 +161,15 @@ class BuilderUI(QMainWindow):
         if stylesheet:
             self.setStyleSheet(stylesheet)
         self.show()
+        self.check_deck()
+    def check_deck(self):
+        """Validates the loaded deck and reports every problem in one dialog."""
+        with timed("deck.validate"):
+            problems = validate_tasks(self.task_manager.tasks, self.discovered_tasks)
+        if problems:
+            QMessageBox.warning(self, "Deck Problems",
+                                f"{len(problems)} problem(s) found in tasks.json:\n\n" + format_problems(problems))
+        return problems
     @pyqtSlot(str)
     def update_global_mode(self, mode):
         self.header.update_mode(mode)
@@ -228,8 +181,8 @@ class BuilderUI(QMainWindow):
             self.update_export_mode_label()
             self.load_export_state()
     def closeEvent(self, event):
-        print("Builder is closing. Cleaning up __pycache__...")
-        clean_pycache(PROJECT_ROOT)
+        if hasattr(self, "preview"):
+            self.preview.close()
         event.accept()
     # -------------- Task Builder Tab --------------
     def create_task_tab(self):
@@ -259,40 +212,144 @@ class BuilderUI(QMainWindow):
         btn_row.addWidget(self.delete_task_btn)
         btn_row.addWidget(self.clear_tasks_btn)
         self.builder_form_layout.addLayout(btn_row)
+        bulk_row = QHBoxLayout()
+        self.duplicate_tasks_btn = QPushButton("Duplicate")
+        self.move_tasks_btn = QPushButton("Move To...")
+        self.change_type_btn = QPushButton("Change Type...")
+        self.find_replace_btn = QPushButton("Find/Replace...")
+        self.undo_btn = QPushButton("Undo")
+        for btn in (self.duplicate_tasks_btn, self.move_tasks_btn, self.change_type_btn,
+                    self.find_replace_btn, self.undo_btn):
+            bulk_row.addWidget(btn)
+        self.builder_form_layout.addLayout(bulk_row)
         self.save_task_list_btn = QPushButton("Save Task List")
         self.builder_form_layout.addWidget(self.save_task_list_btn)
+        self.preview_btn = QPushButton("Preview Deck")
+        self.builder_form_layout.addWidget(self.preview_btn)
         main_layout.addWidget(right, 2)
         self.task_list.itemClicked.connect(self.load_task_details)
         self.add_task_btn.clicked.connect(self.add_task)
         self.delete_task_btn.clicked.connect(self.delete_task)
         self.clear_tasks_btn.clicked.connect(self.clear_all_tasks)
         self.save_task_list_btn.clicked.connect(self.save_tasks)
+        self.duplicate_tasks_btn.clicked.connect(self.duplicate_tasks)
+        self.move_tasks_btn.clicked.connect(self.move_tasks)
+        self.change_type_btn.clicked.connect(self.change_task_type)
+        self.find_replace_btn.clicked.connect(self.find_replace_tasks)
+        self.undo_btn.clicked.connect(self.undo_task_edit)
+        self.preview = GamePreview(lambda: self.task_manager.tasks, self)
+        self.task_manager.add_listener(self.preview.schedule_reload)
+        self.preview_btn.clicked.connect(self.preview.open)
         # IMPORTANT: update builder widget when dropdown selection changes.
         self.task_type_dropdown.currentIndexChanged.connect(self.load_task_template)
+        self.task_forms = {}
+        self.current_task_builder = None
         self.load_task_template()
+        # Reload edited task modules without restarting the builder.
+        self.task_watcher = TaskModuleWatcher(os.path.join(PROJECT_ROOT, "shared", "tasks"), self)
+        self.task_watcher.modulesChanged.connect(self.reload_task_modules)
         return task_tab
     def load_task_template(self):
-        for i in reversed(range(self.builder_widget_layout.count())):
-            widget = self.builder_widget_layout.itemAt(i).widget()
-            if widget:
-                widget.deleteLater()
+        with timed("task_form.load", task_type=self.task_type_dropdown.currentData()):
+            self._load_task_template()
+    def _load_task_template(self):
+        # Builder forms are created once per task type and cached; switching
+        # types only hides and shows them.
+        for _, widget in self.task_forms.values():
+            widget.hide()
+        self.current_task_builder = None
         norm = self.task_type_dropdown.currentData()
-        if norm:
+        if not norm:
+            return
+        form = self.task_forms.get(norm)
+        if form is None:
             module_import = self.discovered_tasks.get(norm)
-            if module_import:
+            if not module_import:
+                return
+            try:
+                mod = importlib.import_module(module_import)
+                task_inst = mod.Task()
+                if hasattr(task_inst, "get_builder_widget"):
+                    widget = task_inst.get_builder_widget()
+                else:
+                    widget = QWidget()
+                    task_inst = None
+            except Exception as e:
+                QMessageBox.critical(self, "Error", f"Error loading template for {norm}: {e}")
+                return
+            form = (task_inst, widget)
+            self.task_forms[norm] = form
+            self.builder_widget_layout.addWidget(widget)
+        self.current_task_builder = form[0]
+        form[1].show()
+    def invalidate_task_form(self, norm):
+        form = self.task_forms.pop(norm, None)
+        if form:
+            form[1].setParent(None)
+            form[1].deleteLater()
+        invalidate_validator(norm)
+    def reload_task_modules(self, changed, removed):
+        """
+        Reloads only the task modules that changed on disk and updates the
+        task-type dropdown in place. The deck in memory is untouched, and the
+        form being edited keeps its contents if its type still exists.
+        """
+        with timed("task_modules.reload"):
+            self._reload_task_modules(changed, removed)
+    def _reload_task_modules(self, changed, removed):
+        current = self.task_type_dropdown.currentData()
+        draft = None
+        if self.current_task_builder and hasattr(self.current_task_builder, "get_task_data"):
+            try:
+                draft = self.current_task_builder.get_task_data()
+            except Exception:
+                draft = None
+        self.task_type_dropdown.blockSignals(True)
+        for filepath in removed + changed:
+            module_import = "shared.tasks." + os.path.splitext(os.path.basename(filepath))[0]
+            old_types = [n for n, m in self.discovered_tasks.items() if m == module_import]
+            new_type = None
+            if filepath in changed:
                 try:
-                    mod = importlib.import_module(module_import)
-                    task_inst = mod.Task()
-                    if hasattr(task_inst, "get_builder_widget"):
-                        widget = task_inst.get_builder_widget()
-                        self.current_task_builder = task_inst
-                    else:
-                        widget = QWidget()
-                        self.current_task_builder = None
-                    self.builder_widget_layout.addWidget(widget)
+                    module = sys.modules.get(module_import)
+                    module = importlib.reload(module) if module else importlib.import_module(module_import)
                 except Exception as e:
-                    QMessageBox.critical(self, "Error", f"Error loading template for {norm}: {e}")
+                    logger.error("Error reloading %s: %s", module_import, e)
+                    self.statusBar().showMessage(f"Error reloading {module_import}: {e}", 10000)
+                    continue
+                if hasattr(module, "TASK_TYPE"):
+                    new_type = normalize_task_type(module.TASK_TYPE)
+            else:
+                sys.modules.pop(module_import, None)
+            for norm in old_types:
+                self.invalidate_task_form(norm)
+                if norm != new_type:
+                    self.discovered_tasks.pop(norm, None)
+                    idx = self.task_type_dropdown.findData(norm)
+                    if idx >= 0:
+                        self.task_type_dropdown.removeItem(idx)
+            if new_type:
+                self.invalidate_task_form(new_type)
+                self.discovered_tasks[new_type] = module_import
+                if self.task_type_dropdown.findData(new_type) < 0:
+                    self.task_type_dropdown.addItem(display_task_type(new_type), new_type)
+            if filepath in changed:
+                logger.info("Reloaded task module %s", module_import, task_type=new_type)
+            else:
+                logger.info("Removed task module %s", module_import)
+        idx = self.task_type_dropdown.findData(current)
+        if idx >= 0:
+            self.task_type_dropdown.setCurrentIndex(idx)
+        self.task_type_dropdown.blockSignals(False)
+        self.load_task_template()
+        if draft and idx >= 0 and self.current_task_builder and hasattr(self.current_task_builder, "set_task_data"):
+            self.current_task_builder.set_task_data(draft)
+        self.statusBar().showMessage(f"Reloaded {len(changed)} task module(s), removed {len(removed)}.", 5000)
+        self.preview.schedule_reload()
     def load_task_details(self, item):
+        with timed("task.select"):
+            self._load_task_details(item)
+    def _load_task_details(self, item):
         data = item.data(Qt.ItemDataRole.UserRole)
         if data:
             norm = data.get("TASK_TYPE", "short_answer")
@@ -301,31 +358,101 @@ class BuilderUI(QMainWindow):
                 self.task_type_dropdown.setCurrentIndex(idx)
             self.load_task_template()
             if self.current_task_builder and hasattr(self.current_task_builder, "set_task_data"):
+                reset_task_fields(self.current_task_builder)
                 self.current_task_builder.set_task_data(data)
     def add_task(self):
         if self.current_task_builder and hasattr(self.current_task_builder, "get_task_data"):
             try:
                 new_data = self.current_task_builder.get_task_data()
                 new_data["TASK_TYPE"] = self.task_type_dropdown.currentData()
-                self.task_manager.add_task(new_data)
+                with timed("task.add"):
+                    self.task_manager.add_task(new_data)
             except Exception as e:
                 QMessageBox.warning(self, "Warning", f"Error adding task: {e}")
         else:
             QMessageBox.warning(self, "Warning", "No task template available to add.")
     def delete_task(self):
-        cur = self.task_list.currentItem()
+        rows = self.task_list.selected_rows()
+        if len(rows) > 1:
+            with timed("tasks.bulk_delete", count=len(rows)):
+                self.task_manager.delete_tasks(rows)
+            self.statusBar().showMessage(f"Deleted {len(rows)} tasks.", 5000)
+            return
+        # With extended selection the current item need not be selected; it
+        # is only used when nothing is.
+        cur = self.task_list.item(rows[0]) if rows else self.task_list.currentItem()
         if cur:
             idx = self.task_list.row(cur)
-            self.task_manager.delete_task(idx)
+            with timed("task.delete"):
+                self.task_manager.delete_task(idx)
         else:
             QMessageBox.warning(self, "Warning", "No task selected.")
+    # -------------- Bulk task edits --------------
+    def _selected_rows_or_warn(self):
+        rows = self.task_list.selected_rows()
+        if not rows:
+            QMessageBox.warning(self, "Warning", "No task selected.")
+        return rows
+    def duplicate_tasks(self):
+        rows = self._selected_rows_or_warn()
+        if rows:
+            with timed("tasks.bulk_duplicate", count=len(rows)):
+                self.task_manager.duplicate_tasks(rows)
+            self.statusBar().showMessage(f"Duplicated {len(rows)} task(s).", 5000)
+    def move_tasks(self):
+        rows = self._selected_rows_or_warn()
+        if not rows:
+            return
+        remaining = len(self.task_manager.tasks) - len(rows)
+        position, ok = QInputDialog.getInt(self, "Move Tasks",
+                                           f"Move {len(rows)} task(s) to position (1-{remaining + 1}):",
+                                           rows[0] + 1, 1, remaining + 1)
+        if ok:
+            with timed("tasks.bulk_move", count=len(rows)):
+                self.task_manager.move_tasks(rows, position - 1)
+            self.statusBar().showMessage(f"Moved {len(rows)} task(s) to position {position}.", 5000)
+    def change_task_type(self):
+        rows = self._selected_rows_or_warn()
+        if not rows:
+            return
+        names = [display_task_type(norm) for norm in self.discovered_tasks]
+        name, ok = QInputDialog.getItem(self, "Change Task Type",
+                                        f"Convert {len(rows)} task(s) to:", names, 0, False)
+        if not ok:
+            return
+        norm = list(self.discovered_tasks)[names.index(name)]
+        with timed("tasks.bulk_change_type", count=len(rows)):
+            converted, skipped = self.task_manager.change_type(rows, norm, self.discovered_tasks[norm])
+        message = f"Converted {converted} task(s) to {name}."
+        if skipped:
+            QMessageBox.warning(self, "Change Task Type",
+                                message + f"\n\n{len(skipped)} task(s) have fields incompatible with {name} "
+                                "and were left unchanged:\n\n" + format_problems(skipped))
+        else:
+            self.statusBar().showMessage(message, 5000)
+    def find_replace_tasks(self):
+        dialog = FindReplaceDialog(has_selection=bool(self.task_list.selectedItems()), parent=self)
+        if dialog.exec() != QDialog.DialogCode.Accepted:
+            return
+        find, replace, selected_only, match_case = dialog.values()
+        rows = self.task_list.selected_rows() if selected_only else None
+        with timed("tasks.bulk_find_replace"):
+            changed = self.task_manager.find_replace(find, replace, rows=rows, match_case=match_case)
+        self.statusBar().showMessage(f"Replaced text in {changed} task(s).", 5000)
+    def undo_task_edit(self):
+        label = self.task_manager.undo()
+        if label:
+            self.statusBar().showMessage(f"Undid: {label}", 5000)
+        else:
+            self.statusBar().showMessage("Nothing to undo.", 3000)
     def clear_all_tasks(self):
         conf = QMessageBox.question(self, "Confirm", "Clear all tasks?",
                                     QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
         if conf == QMessageBox.StandardButton.Yes:
             self.task_manager.clear_tasks()
     def save_tasks(self):
-        self.task_manager.save_tasks()
+        with timed("tasks.save"):
+            self.task_manager.save_tasks()
         QMessageBox.information(self, "Saved", "Task list saved.")
     # -------------- Gift Card Selection Tab --------------
     def create_gift_card_tab(self):
@@ -409,6 +536,13 @@ class BuilderUI(QMainWindow):
         self.custom_exe_name.setPlaceholderText("e.g., ScammerPaybackGame")
         layout.addWidget(self.custom_exe_name)
         
+        # Bundle layout: one-file is a single EXE, one-folder starts faster.
+        layout.addWidget(QLabel("Export Layout:"))
+        self.export_layout_combo = QComboBox()
+        self.export_layout_combo.addItem("One File (single EXE)", "onefile")
+        self.export_layout_combo.addItem("One Folder (startup optimised)", "onedir")
+        layout.addWidget(self.export_layout_combo)
+        
         # Security mode selection controls
         layout.addWidget(QLabel("Select Security Mode:"))
         self.export_security_slider = QSlider(Qt.Orientation.Horizontal)
@@ -466,7 +600,8 @@ class BuilderUI(QMainWindow):
                 from builder import security_settings
                 _, _, opts = security_settings.set_mode(mode)
             # Call export_exe(); it will display its own detailed report dialog.
-            success, output = export_exe(name, PROJECT_ROOT, opts, disable_lockdown=False)
+            success, output = export_exe(name, PROJECT_ROOT, opts, disable_lockdown=False,
+                                         layout=self.export_layout_combo.currentData())
             # Update status label in the builder UI
             if success:
                 self.export_status_label.setText("Export Successful!")
@@ -475,8 +610,31 @@ class BuilderUI(QMainWindow):
         export_btn.clicked.connect(on_export)
         layout.addWidget(export_btn)
         
+        dry_run_btn = QPushButton("Dry Run (Bundle Footprint)")
+        dry_run_btn.clicked.connect(self.show_export_dry_run)
+        layout.addWidget(dry_run_btn)
+        
+        history_btn = QPushButton("View Export History")
+        history_btn.clicked.connect(self.show_export_history)
+        layout.addWidget(history_btn)
+        
         return tab
 
+    def show_export_dry_run(self):
+        from builder.footprint import analyze_footprint, format_footprint, FootprintDialog
+        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+        try:
+            with timed("export.dry_run"):
+                report = format_footprint(analyze_footprint(PROJECT_ROOT))
+        finally:
+            QApplication.restoreOverrideCursor()
+        FootprintDialog(report, self).exec()
+
+    def show_export_history(self):
+        from builder.export_history import ExportHistoryDialog
+        dialog = ExportHistoryDialog(PROJECT_ROOT, self)
+        dialog.exec()
+
     def on_export_slider_changed(self, val):
         mode = SECURITY_MODES.get(val, "Ethical")
         if mode == "Custom":
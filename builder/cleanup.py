@@ -1,6 +1,29 @@
+# builder/cleanup.py
+"""
+Bytecode cache location and manual __pycache__ cleanup.
+
+The builder writes bytecode to a persistent cache outside the source tree
+(sys.pycache_prefix), so the tree stays clean and warm starts and exports
+reuse compiled modules instead of recompiling. The location is
+~/.nachocore/pycache unless NACHOCORE_PYCACHE_DIR or Python's own
+PYTHONPYCACHEPREFIX is set.
+
+Command line (nothing here runs automatically):
+    python -m builder.cleanup tree     # remove __pycache__ folders in the project
+    python -m builder.cleanup cache    # clear the bytecode cache
+"""
 import os
 import shutil
 
+from shared.utils.pycache import get_pycache_prefix
+
+
+def clear_bytecode_cache():
+    prefix = get_pycache_prefix()
+    print("Clearing bytecode cache:", prefix)
+    shutil.rmtree(prefix, ignore_errors=True)
+
+
 def clean_pycache(root_dir):
     """
     Recursively removes all __pycache__ directories within root_dir.
@@ -19,3 +42,15 @@ def clean_pycache(root_dir):
                     dirnames.remove(dirname)
                 except Exception as e:
                     print(f"Error removing {pycache_path}: {e}")
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Remove compiled bytecode.")
+    parser.add_argument("target", choices=["tree", "cache"],
+                        help="tree: __pycache__ folders in the project; cache: the persistent bytecode cache")
+    args = parser.parse_args()
+    if args.target == "tree":
+        clean_pycache(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+    else:
+        clear_bytecode_cache()
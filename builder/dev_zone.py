@@ -11,6 +11,9 @@ one of four modes: Ethical, Unethical, Grift, or Custom.
   specific security measures.
 The widget now loads the last set state from the configuration so that the slider and,
 if in Custom mode, the checkboxes reflect the saved state.
+Below the security controls, a Performance panel shows live timings of builder
+operations and the last export's stages, profiles the next user action with
+cProfile, and measures import times of the builder's modules.
 """
 
 import os
@@ -18,10 +21,20 @@ import sys
 import json
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QSlider, QPushButton, 
-    QCheckBox, QComboBox, QMessageBox, QFormLayout
+    QCheckBox, QComboBox, QMessageBox, QFormLayout, QGroupBox, QTabWidget,
+    QTableWidget, QTableWidgetItem, QHeaderView, QApplication
 )
-from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, pyqtSlot
 from builder import security_settings
+from builder import profiling
+from builder.export_history import load_history
+from shared.utils.import_timing import measure_import_times, slowest
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# Modules offered in the import-time view.
+IMPORT_TIMING_MODULES = ["builder.builder", "builder.export", "game.game", "generate_manifest"]
+TIMINGS_REFRESH_MS = 1000
 
 # Mapping slider values to mode names.
 SECURITY_MODES = {
@@ -109,6 +122,10 @@ class DevZoneWidget(QWidget):
         self.saveButton = QPushButton("Apply Security Mode")
         self.saveButton.clicked.connect(self.save_mode)
         layout.addWidget(self.saveButton)
+
+        # Performance tools.
+        self.performancePanel = PerformancePanel()
+        layout.addWidget(self.performancePanel, 1)
     
     @pyqtSlot(int)
     def on_slider_changed(self, value):
@@ -168,6 +185,166 @@ class DevZoneWidget(QWidget):
         else:
             QMessageBox.critical(self, "Error", message)
 
+def _fill_table(table, rows):
+    table.setRowCount(len(rows))
+    for r, row in enumerate(rows):
+        for c, value in enumerate(row):
+            item = QTableWidgetItem(str(value))
+            if c > 0:
+                item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+            table.setItem(r, c, item)
+
+
+def _make_table(headers):
+    table = QTableWidget(0, len(headers))
+    table.setHorizontalHeaderLabels(headers)
+    table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+    table.verticalHeader().setVisible(False)
+    table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+    return table
+
+
+class PerformancePanel(QGroupBox):
+    """Timings, cProfile capture and import times for finding slow builder paths."""
+
+    def __init__(self, parent=None):
+        super().__init__("Performance", parent)
+        layout = QVBoxLayout(self)
+        tabs = QTabWidget()
+        tabs.addTab(self.create_timings_tab(), "Timings")
+        tabs.addTab(self.create_profiler_tab(), "Profiler")
+        tabs.addTab(self.create_imports_tab(), "Import Times")
+        layout.addWidget(tabs)
+        self.refreshTimer = QTimer(self)
+        self.refreshTimer.setInterval(TIMINGS_REFRESH_MS)
+        self.refreshTimer.timeout.connect(self.refresh_timings)
+        self.refreshTimer.start()
+
+    # -------------- Live timings --------------
+    def create_timings_tab(self):
+        tab = QWidget()
+        layout = QVBoxLayout(tab)
+        self.timingsTable = _make_table(["Operation", "Count", "Last (ms)", "Mean (ms)", "Max (ms)"])
+        layout.addWidget(self.timingsTable)
+        self.lastExportLabel = QLabel("")
+        self.lastExportLabel.setWordWrap(True)
+        layout.addWidget(self.lastExportLabel)
+        reset_button = QPushButton("Reset Timings")
+        reset_button.clicked.connect(self.reset_timings)
+        layout.addWidget(reset_button)
+        return tab
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh_timings()
+        self.refresh_last_export()
+
+    def refresh_timings(self):
+        if not self.isVisible():
+            return
+        _fill_table(self.timingsTable, [
+            (t.name, t.count, f"{t.last * 1000:.1f}", f"{t.mean * 1000:.1f}", f"{t.max * 1000:.1f}")
+            for t in profiling.get_timings()
+        ])
+
+    def refresh_last_export(self):
+        history = load_history(PROJECT_ROOT, limit=1)
+        if history:
+            last = history[-1]
+            stages = ", ".join(f"{name} {seconds:.2f} s" for name, seconds in last.get("stages", {}).items())
+            cached = " (from cache)" if last.get("cache_hit") else ""
+            self.lastExportLabel.setText(
+                f"Last export: {last.get('name', '?')} at {last.get('timestamp', '?')}{cached}, "
+                f"{last.get('total_seconds', 0.0):.2f} s total. {stages}")
+        else:
+            self.lastExportLabel.setText("Last export: none recorded yet.")
+
+    def reset_timings(self):
+        profiling.reset_timings()
+        self.refresh_timings()
+
+    # -------------- cProfile capture --------------
+    def create_profiler_tab(self):
+        tab = QWidget()
+        layout = QVBoxLayout(tab)
+        row = QHBoxLayout()
+        self.profileButton = QPushButton("Profile Next Action")
+        self.profileButton.clicked.connect(self.arm_profiler)
+        row.addWidget(self.profileButton)
+        row.addWidget(QLabel("Sort by:"))
+        self.profileSort = QComboBox()
+        self.profileSort.addItem("Cumulative time", "cumulative")
+        self.profileSort.addItem("Own time", "own")
+        self.profileSort.currentIndexChanged.connect(self.show_hotspots)
+        row.addWidget(self.profileSort)
+        layout.addLayout(row)
+        self.profileStatus = QLabel("Click the button, then perform the action to profile.")
+        layout.addWidget(self.profileStatus)
+        self.hotspotTable = _make_table(["Function", "Calls", "Own (ms)", "Cumulative (ms)"])
+        layout.addWidget(self.hotspotTable)
+        self.profiler = profiling.ActionProfiler(self)
+        self.profiler.captured.connect(self.on_profile_captured)
+        self.hotspots = []
+        return tab
+
+    def arm_profiler(self):
+        self.profiler.arm()
+        self.profileStatus.setText("Waiting for the next click or key press...")
+
+    def on_profile_captured(self, label, hotspots, seconds):
+        self.hotspots = hotspots
+        self.profileStatus.setText(f"Profiled {label}: {seconds * 1000:.1f} ms")
+        self.show_hotspots()
+
+    def show_hotspots(self):
+        if self.profileSort.currentData() == "own":
+            rows = sorted(self.hotspots, key=lambda h: h.own_seconds, reverse=True)
+        else:
+            rows = sorted(self.hotspots, key=lambda h: h.cumulative_seconds, reverse=True)
+        _fill_table(self.hotspotTable, [
+            (h.function, h.calls, f"{h.own_seconds * 1000:.2f}", f"{h.cumulative_seconds * 1000:.2f}")
+            for h in rows
+        ])
+
+    # -------------- Import times --------------
+    def create_imports_tab(self):
+        tab = QWidget()
+        layout = QVBoxLayout(tab)
+        row = QHBoxLayout()
+        self.importModule = QComboBox()
+        self.importModule.setEditable(True)
+        self.importModule.addItems(IMPORT_TIMING_MODULES)
+        row.addWidget(self.importModule, 1)
+        measure_button = QPushButton("Measure Import Times")
+        measure_button.clicked.connect(self.measure_imports)
+        row.addWidget(measure_button)
+        layout.addLayout(row)
+        self.importStatus = QLabel("Imports the module in a fresh interpreter with -X importtime.")
+        layout.addWidget(self.importStatus)
+        self.importTable = _make_table(["Module", "Self (ms)", "Cumulative (ms)"])
+        layout.addWidget(self.importTable)
+        return tab
+
+    def measure_imports(self):
+        module = self.importModule.currentText().strip()
+        if not module:
+            return
+        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+        try:
+            records = measure_import_times(module, PROJECT_ROOT)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Could not measure imports: {e}")
+            return
+        finally:
+            QApplication.restoreOverrideCursor()
+        total_ms = sum(r.cumulative_us for r in records if r.depth == 0) / 1000
+        self.importStatus.setText(f"{module}: {len(records)} modules imported in {total_ms:.1f} ms.")
+        _fill_table(self.importTable, [
+            ("  " * r.depth + r.name, f"{r.self_us / 1000:.1f}", f"{r.cumulative_us / 1000:.1f}")
+            for r in slowest(records, limit=40)
+        ])
+
+
 if __name__ == "__main__":
     from PyQt6.QtWidgets import QApplication
     app = QApplication(sys.argv)
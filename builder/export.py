@@ -3,25 +3,26 @@ import os
 import sys
 import json
 import subprocess
-import glob
-import importlib.util
+import re
+import time
 import shutil
 import pprint
+import tempfile
 
 # Define PROJECT_ROOT (assuming export.py is in the builder folder)
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 
-# Try to import get_data_path from shared/utils/data_helpers; otherwise, define fallback.
-try:
-    from shared.utils.data_helpers import get_data_path
-except ImportError:
-    def get_data_path(relative_path):
-        return os.path.join(PROJECT_ROOT, relative_path)
+from shared.utils.data_helpers import get_data_path, EMBEDDED_RESOURCES
+from shared.theme.theme import load_stylesheet
 
-from builder.utils import normalize_task_type
+from shared.utils import logger
 
 # Import the static manifest generator.
-from generate_manifest import generate_static_manifest
+from generate_manifest import generate_static_manifest, generate_static_resources, scan_task_modules
+from builder.validation import validate_tasks, format_problems
+from builder.export_history import StageTimer, append_history, format_size
+from builder.artifact_cache import ArtifactCache, collect_bundle_inputs, compute_key, path_size, remove_path
+from shared.utils.pycache import get_pycache_prefix
 
 # Import required PyQt6 widgets
 from PyQt6.QtWidgets import (
@@ -31,36 +32,20 @@ from PyQt6.QtWidgets import (
 
 def get_hidden_imports(project_root):
     """
-    Collect hidden imports for PyInstaller by scanning the shared/tasks folder.
+    Collect hidden imports for PyInstaller: every task module in shared/tasks
+    plus the shared modules the game loads dynamically.
     If running in a frozen state, we load from static_manifest.py instead.
     """
     if getattr(sys, "frozen", False):
         try:
             from builder.static_manifest import TASK_MANIFEST
-            print("DEBUG: Frozen state. Using TASK_MANIFEST:", TASK_MANIFEST)
+            logger.debug("Frozen state. Using TASK_MANIFEST: %s", TASK_MANIFEST)
             return list(TASK_MANIFEST.values())
         except Exception as e:
-            print("DEBUG: Error importing TASK_MANIFEST:", e)
+            logger.error("Error importing TASK_MANIFEST: %s", e)
             return []
-    hidden_imports = []
-    tasks_folder = os.path.join(get_data_path("shared/tasks"))
-    for filepath in glob.glob(os.path.join(tasks_folder, "*.py")):
-        filename = os.path.basename(filepath)
-        if filename == "__init__.py":
-            continue
-        module_name = os.path.splitext(filename)[0]
-        spec = importlib.util.spec_from_file_location(module_name, filepath)
-        module = importlib.util.module_from_spec(spec)
-        try:
-            spec.loader.exec_module(module)
-            if hasattr(module, "TASK_TYPE"):
-                normalized = normalize_task_type(module.TASK_TYPE)
-                hidden_import = f"shared.tasks.{module_name}"
-                print("DEBUG: Found module '{}' with TASK_TYPE '{}' normalized to '{}'".format(
-                    module_name, module.TASK_TYPE, normalized))
-                hidden_imports.append(hidden_import)
-        except Exception as e:
-            print("DEBUG: Error importing {}: {}".format(filename, e))
+    # Task types are read from source; no task module is imported here.
+    hidden_imports = sorted(scan_task_modules(get_data_path(os.path.join("shared", "tasks"))).values())
     # Also include any additional shared modules
     additional = [
         "shared.config",
@@ -72,6 +57,10 @@ def get_hidden_imports(project_root):
         "shared.utils.security_monitor",
         "shared.utils.logger",
         "shared.utils.ui_keyboard",
+        "shared.utils.data_helpers",
+        "game.runtime_config",
+        "builder.static_manifest",
+        "builder.static_resources",
     ]
     hidden_imports.extend(additional)
     return hidden_imports
@@ -80,6 +69,7 @@ def get_data_files(project_root):
     """
     Returns a list of data files to bundle with the EXE.
     Format: "absolute_path;relative_destination"
+    Files compiled into builder/static_resources.py are not bundled separately.
     """
     data_files = []
     folders = [
@@ -97,21 +87,25 @@ def get_data_files(project_root):
                 if f.lower().endswith((".json", ".qss")):
                     full_path = os.path.join(root, f)
                     rel_path = os.path.relpath(full_path, project_root)
+                    if rel_path.replace("\\", "/") in EMBEDDED_RESOURCES:
+                        continue
                     data_files.append("{};{}".format(full_path, os.path.dirname(rel_path)))
     return data_files
 
 def read_tasks_summary(project_root):
     """
-    Reads tasks.json (if it exists) and returns a summary of tasks:
-    For each task, it shows the TASK_TYPE and, if available, the question text.
+    Reads tasks.json (if it exists) and returns (summary, task count). For each
+    task the summary shows the TASK_TYPE and, if available, the question text.
     """
     tasks_file = os.path.join(project_root, "builder", "tasks", "tasks.json")
     summary_lines = []
+    task_count = 0
     if os.path.exists(tasks_file):
         try:
             with open(tasks_file, "r") as f:
                 tasks = json.load(f)
             if isinstance(tasks, list):
+                task_count = len(tasks)
                 for idx, task in enumerate(tasks, start=1):
                     task_type = task.get("TASK_TYPE", "Unknown")
                     question = task.get("question", "<no question>")
@@ -122,81 +116,234 @@ def read_tasks_summary(project_root):
             summary_lines.append(f"Error reading tasks.json: {e}")
     else:
         summary_lines.append("tasks.json not found.")
-    return "\n".join(summary_lines)
+    return "\n".join(summary_lines), task_count
 
-def export_exe(custom_name, project_root, security_options, disable_lockdown=False):
+# PyInstaller log lines start with milliseconds since the build began; the
+# first PYZ step marks the end of analysis and the start of packaging.
+PYINSTALLER_LOG_LINE = re.compile(r"^(\d+) INFO: (.*)$", re.MULTILINE)
+PACKAGING_MARKERS = ("checking PYZ", "Building PYZ")
+
+def split_pyinstaller_phases(log_text, elapsed):
     """
-    Main export function that:
-    1) Updates config.json with current security settings and gift card.
-    2) Generates a static manifest (builder/static_manifest.py).
-    3) Builds the EXE with PyInstaller (UPX compression, strip).
-    4) Cleans up build artifacts and dist folder.
-    5) Shows a single "Export Report" dialog with tasks, gift card, and settings info.
+    Splits a PyInstaller run's wall-clock time into analysis and packaging
+    using the timestamps in its log. Returns (analysis_seconds, packaging_seconds),
+    or (elapsed, 0.0) if the log has no packaging marker.
     """
-    # 1) Update config.json
-    config_path = os.path.join(project_root, "builder", "config.json")
+    for match in PYINSTALLER_LOG_LINE.finditer(log_text or ""):
+        if match.group(2).startswith(PACKAGING_MARKERS):
+            analysis = min(int(match.group(1)) / 1000.0, elapsed)
+            return analysis, elapsed - analysis
+    return elapsed, 0.0
+
+# Export layouts offered in the Export tab.
+# "onefile" unpacks the whole archive to a temp folder on every launch.
+# "onedir" ships a folder whose data files are read in place, with bytecode
+# precompiled at optimisation level 2 (needs PyInstaller 6.6+), for faster
+# cold starts.
+EXPORT_LAYOUTS = {
+    "onefile": ["--onefile"],
+    "onedir": ["--onedir", "--optimize", "2"],
+}
+EXE_SUFFIX = ".exe" if sys.platform.startswith("win") else ""
+STARTUP_PROBE_TIMEOUT = 60
+
+def measure_startup(executable, timeout=STARTUP_PROBE_TIMEOUT):
+    """
+    Launches an exported game in startup-probe mode and returns the seconds from
+    launch until its first task is on screen, or None if it could not be measured.
+    The probe run starts no lockdown features and exits on its own.
+    """
+    if not os.path.exists(executable):
+        return None
+    fd, probe_path = tempfile.mkstemp(prefix="nachocore_probe_", suffix=".txt")
+    os.close(fd)
+    os.remove(probe_path)
+    env = dict(os.environ, NACHOCORE_STARTUP_PROBE=probe_path)
+    start = time.time()
     try:
-        if os.path.exists(config_path):
-            with open(config_path, "r") as f:
-                config = json.load(f)
-        else:
-            config = {}
+        proc = subprocess.Popen([executable], env=env, cwd=os.path.dirname(executable))
+        try:
+            proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            logger.warning("Startup probe timed out after %ss", timeout)
+            return None
+        with open(probe_path, "r") as f:
+            return float(f.read().strip()) - start
     except Exception as e:
-        print("DEBUG: Error reading config.json:", e)
-        config = {}
-    config.update(security_options)
+        logger.error("Startup probe failed: %s", e)
+        return None
+    finally:
+        if os.path.exists(probe_path):
+            os.remove(probe_path)
+
+def validate_deck(project_root):
+    """
+    Validates tasks.json against the task schemas before anything is built.
+    Returns a list of (task_index, message) problems; empty when the deck is valid.
+    """
+    tasks_file = os.path.join(project_root, "builder", "tasks", "tasks.json")
+    if not os.path.exists(tasks_file):
+        return []
     try:
-        with open(config_path, "w") as f:
-            json.dump(config, f, indent=4)
+        with open(tasks_file, "r") as f:
+            tasks = json.load(f)
     except Exception as e:
-        return False, f"Error writing config: {e}"
+        return [(0, f"Error reading tasks.json: {e}")]
+    task_modules = scan_task_modules(os.path.join(project_root, "shared", "tasks"))
+    return validate_tasks(tasks, task_modules)
+
+def export_exe(custom_name, project_root, security_options, disable_lockdown=False, layout="onefile"):
+    """
+    Main export function that:
+    0) Validates the deck and refuses to build if any task is malformed.
+    1) Updates config.json with current security settings and gift card.
+    2) Generates a static manifest (builder/static_manifest.py) and compiles the
+       stylesheet, config and deck into builder/static_resources.py.
+    3) Builds the EXE with PyInstaller (UPX compression, strip), or restores an
+       identical earlier build from the local artifact cache.
+    4) Stores the new artifact in the cache and cleans up the dist folder.
+    4b) Launches the artifact once to time launch-to-first-task for the layout.
+    5) Shows a single "Export Report" dialog with tasks, gift card, and settings info,
+       per-stage timings and the artifact size, and appends them to the export history.
+    """
+    timer = StageTimer()
+    # 0) Validate the deck
+    with timer.stage("validate"):
+        problems = validate_deck(project_root)
+    if problems:
+        return False, "Deck validation failed:\n" + format_problems(problems)
+    
+    # 1) Update config.json
+    with timer.stage("config_update"):
+        config_path = os.path.join(project_root, "builder", "config.json")
+        try:
+            if os.path.exists(config_path):
+                with open(config_path, "r") as f:
+                    config = json.load(f)
+            else:
+                config = {}
+        except Exception as e:
+            logger.error("Error reading config.json: %s", e)
+            config = {}
+        config.update(security_options)
+        try:
+            with open(config_path, "w") as f:
+                json.dump(config, f, indent=4)
+        except Exception as e:
+            return False, f"Error writing config: {e}"
     
-    # 2) Generate static manifest
-    generate_static_manifest()
+    # 2) Generate static manifest and the embedded resource bundle
+    with timer.stage("manifest"):
+        generate_static_manifest()
+        generate_static_resources()
     
     # 3) Build the EXE
     game_script = os.path.join(project_root, "game", "game.py")
-    hidden_imports = get_hidden_imports(project_root)
-    data_files = get_data_files(project_root)
+    with timer.stage("collect"):
+        hidden_imports = get_hidden_imports(project_root)
+        data_files = get_data_files(project_root)
     
     export_dir = os.path.join(project_root, "exported")
     os.makedirs(export_dir, exist_ok=True)
     
-    cmd = [
-        "pyinstaller",
-        "--onefile",
+    options = EXPORT_LAYOUTS.get(layout, EXPORT_LAYOUTS["onefile"]) + [
         "--windowed",
         "--strip",
         "--upx-dir", "C:/upx",  # Adjust if UPX is in your PATH or remove if not needed
-        "--name", custom_name,
         "--paths", project_root,
     ]
     for imp in hidden_imports:
-        cmd.extend(["--hidden-import", imp])
+        options.extend(["--hidden-import", imp])
+    analysis_options = list(options)
     for df in data_files:
-        cmd.extend(["--add-data", df])
-    cmd.append(game_script)
+        options.extend(["--add-data", df])
+    options.append(game_script)
     
-    print("DEBUG: Running PyInstaller with command:")
-    print(" ".join(cmd))
+    # One-file exports produce dist/<name>.exe; one-folder exports produce
+    # dist/<name>/ with the executable inside it.
+    final_exe = custom_name + EXE_SUFFIX
+    dist_dir = os.path.join(project_root, "dist")
+    if layout == "onedir":
+        source_exe = os.path.join(dist_dir, custom_name)
+        destination_exe = os.path.join(export_dir, custom_name)
+        launch_exe = os.path.join(destination_exe, final_exe)
+    else:
+        source_exe = os.path.join(dist_dir, final_exe)
+        destination_exe = os.path.join(export_dir, final_exe)
+        launch_exe = destination_exe
+    
+    # Reuse a previous build of identical inputs from the local artifact cache.
+    cache = ArtifactCache()
+    # A one-file artifact is renamed as it is restored, but a one-folder
+    # bundle holds <name>.exe, so its name is part of the key.
+    key_options = options + (["--name", custom_name] if layout == "onedir" else [])
+    with timer.stage("cache_lookup"):
+        artifact_key = compute_key(collect_bundle_inputs(project_root, data_files), key_options, project_root)
+        cache_hit = cache.restore(artifact_key, destination_exe)
+    # PyInstaller keeps its analysis in the work directory; keep that in the
+    # cache too so changed decks only redo what actually changed. It is keyed
+    # per checkout so concurrent exports never share a work directory.
+    analysis_key = compute_key([], analysis_options, project_root, scope=os.path.abspath(project_root))
+    work_dir = cache.work_dir(analysis_key, label="pyinstaller work")
+    cmd = ["pyinstaller", "--name", custom_name,
+           "--workpath", work_dir, "--specpath", work_dir] + options
+    
+    logger.debug("Running PyInstaller with command: %s", " ".join(cmd))
     
     try:
         # On Windows, we can avoid extra console windows by using CREATE_NO_WINDOW
         creationflags = 0
         if sys.platform.startswith("win"):
-            import subprocess
             creationflags = subprocess.CREATE_NO_WINDOW
         
-        result = subprocess.run(
-            cmd, check=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            creationflags=creationflags
-        )
+        if cache_hit:
+            output = f"Restored from artifact cache ({artifact_key[:12]})."
+            logger.info("Artifact cache hit", key=artifact_key[:12])
+        else:
+            build_start = time.perf_counter()
+            # PyInstaller's isolated analysis subprocesses import project modules;
+            # point them at the shared bytecode cache so they neither recompile
+            # on every export nor write __pycache__ into the tree.
+            env = dict(os.environ, PYTHONPYCACHEPREFIX=get_pycache_prefix())
+            result = subprocess.run(
+                cmd, check=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                env=env,
+                creationflags=creationflags
+            )
+            output = result.stdout
+            analysis, packaging = split_pyinstaller_phases(result.stderr, time.perf_counter() - build_start)
+            timer.add("pyinstaller_analysis", analysis)
+            timer.add("pyinstaller_packaging", packaging)
+            logger.info("PyInstaller finished", analysis_ms=round(analysis * 1000, 2),
+                        packaging_ms=round(packaging * 1000, 2))
+            
+            # 4) Move the artifact, store it in the cache and clean up
+            with timer.stage("move_cleanup"):
+                if os.path.exists(source_exe):
+                    # Off Windows a one-file export and a one-folder export of
+                    # the same name share this path; replace whichever is there.
+                    remove_path(destination_exe)
+                    shutil.move(source_exe, destination_exe)
+                    cache.store(artifact_key, destination_exe, label=custom_name)
+                if os.path.exists(dist_dir):
+                    shutil.rmtree(dist_dir)
+                cache.record_work(analysis_key)
+        artifact_size = path_size(destination_exe) if os.path.exists(destination_exe) else 0
+        launch_seconds = measure_startup(launch_exe)
         
         # Build the final report
         report = "Export Report:\n\n"
+        report += "Export Timings:\n" + timer.format() + "\n"
+        report += f"Artifact: {destination_exe} ({format_size(artifact_size)}, layout: {layout})"
+        report += " [from cache]\n" if cache_hit else "\n"
+        if launch_seconds is not None:
+            report += f"Launch to first task: {launch_seconds:.2f} s\n\n"
+        else:
+            report += "Launch to first task: not measured\n\n"
         try:
             from builder.static_manifest import TASK_MANIFEST
             report += "Imported Task Types (TASK_MANIFEST):\n" + pprint.pformat(TASK_MANIFEST) + "\n\n"
@@ -213,25 +360,20 @@ def export_exe(custom_name, project_root, security_options, disable_lockdown=Fal
         except Exception as e:
             report += f"Error loading SECURITY_SETTINGS_STATIC: {e}\n\n"
         
-        tasks_summary = read_tasks_summary(project_root)
+        tasks_summary, task_count = read_tasks_summary(project_root)
         report += "Exported Tasks Summary:\n" + tasks_summary + "\n\n"
         
-        # 4) Cleanup build artifacts
-        final_exe = custom_name + ".exe"
-        dist_dir = os.path.join(project_root, "dist")
-        build_dir = os.path.join(project_root, "build")
-        spec_file = os.path.join(project_root, custom_name + ".spec")
-        source_exe = os.path.join(dist_dir, final_exe)
-        destination_exe = os.path.join(export_dir, final_exe)
-        
-        if os.path.exists(source_exe):
-            shutil.move(source_exe, destination_exe)
-        if os.path.exists(dist_dir):
-            shutil.rmtree(dist_dir)
-        if os.path.exists(build_dir):
-            shutil.rmtree(build_dir)
-        if os.path.exists(spec_file):
-            os.remove(spec_file)
+        append_history(project_root, {
+            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "name": custom_name,
+            "stages": {name: round(seconds, 3) for name, seconds in timer.stages.items()},
+            "total_seconds": round(timer.total, 3),
+            "artifact_size": artifact_size,
+            "cache_hit": cache_hit,
+            "layout": layout,
+            "launch_seconds": round(launch_seconds, 3) if launch_seconds is not None else None,
+            "task_count": task_count,
+        })
         
         # 5) Show a single "Export Report" dialog
         app = QApplication.instance()
@@ -239,11 +381,7 @@ def export_exe(custom_name, project_root, security_options, disable_lockdown=Fal
             app = QApplication(sys.argv)
         
         # Optional: load your style sheet
-        stylesheet_path = os.path.join(PROJECT_ROOT, "shared", "theme", "styles.qss")
-        stylesheet = ""
-        if os.path.exists(stylesheet_path):
-            with open(stylesheet_path, "r") as f:
-                stylesheet = f.read()
+        stylesheet = load_stylesheet()
         
         dialog = QDialog()
         dialog.setWindowTitle("Export Report")
@@ -272,10 +410,12 @@ def export_exe(custom_name, project_root, security_options, disable_lockdown=Fal
         dialog.exec()
         
         # Return success
-        return True, result.stdout
+        return True, output
     
     except subprocess.CalledProcessError as e:
         return False, f"PyInstaller error: {e.stderr}"
+    except OSError as e:
+        return False, f"Error writing the exported artifact: {e}"
 
 if __name__ == "__main__":
     security_opts = {
@@ -295,6 +435,6 @@ if __name__ == "__main__":
     }
     success, output = export_exe("ScammerPaybackGame", PROJECT_ROOT, security_opts, disable_lockdown=False)
     if success:
-        print("Export successful!")
+        logger.info("Export successful!")
     else:
-        print("Export failed:", output)
+        logger.error("Export failed: %s", output)
@@ -0,0 +1,167 @@
+# builder/export_history.py
+"""
+Per-stage export timing and a persisted export history.
+
+export_exe() times each stage with a StageTimer, adds the timings and the
+artifact size to the Export Report and appends them to
+exported/export_history.jsonl. ExportHistoryDialog charts that history so
+export-time regressions are visible as decks and task types grow.
+"""
+import os
+import json
+from collections import OrderedDict
+
+from PyQt6.QtWidgets import (
+    QWidget, QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QPlainTextEdit
+)
+from PyQt6.QtGui import QPainter, QColor
+from PyQt6.QtCore import Qt
+
+from shared.utils import logger
+from builder.profiling import timed
+
+HISTORY_FILENAME = "export_history.jsonl"
+
+# Stage colours for the history chart, in export order.
+STAGE_COLORS = OrderedDict([
+    ("validate", "#8e8e8e"),
+    ("config_update", "#5b8def"),
+    ("manifest", "#3fb8af"),
+    ("collect", "#9b6bd6"),
+    ("cache_lookup", "#d6c26b"),
+    ("pyinstaller_analysis", "#f0a030"),
+    ("pyinstaller_packaging", "#e0603a"),
+    ("move_cleanup", "#6abf4b"),
+])
+
+
+class StageTimer:
+    """Records wall-clock durations of named export stages, in order."""
+
+    def __init__(self):
+        self.stages = OrderedDict()
+
+    def stage(self, name):
+        return timed(name, prefix="export.", level=logger.INFO, record_to=self.add)
+
+    def add(self, name, seconds):
+        self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+    @property
+    def total(self):
+        return sum(self.stages.values())
+
+    def format(self):
+        lines = [f"{name:<24}{seconds:8.2f} s" for name, seconds in self.stages.items()]
+        lines.append(f"{'total':<24}{self.total:8.2f} s")
+        return "\n".join(lines)
+
+
+def format_size(num_bytes):
+    size = float(num_bytes)
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def get_history_path(project_root):
+    return os.path.join(project_root, "exported", HISTORY_FILENAME)
+
+
+def append_history(project_root, entry):
+    """Appends one export record to the history file."""
+    path = get_history_path(project_root)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+    except Exception as e:
+        logger.error("Error writing export history: %s", e)
+
+
+def load_history(project_root, limit=50):
+    """Returns up to the last `limit` export records, oldest first."""
+    path = get_history_path(project_root)
+    entries = []
+    if not os.path.exists(path):
+        return entries
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    logger.warning("Skipping malformed export history line.")
+    except Exception as e:
+        logger.error("Error reading export history: %s", e)
+    return entries[-limit:] if limit else entries
+
+
+class ExportHistoryChart(QWidget):
+    """Stacked bar chart of stage timings, one bar per export."""
+
+    def __init__(self, entries, parent=None):
+        super().__init__(parent)
+        self.entries = entries
+        self.setMinimumSize(560, 260)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        rect = self.rect().adjusted(48, 12, -12, -28)
+        painter.setPen(QColor("#888888"))
+        painter.drawLine(rect.bottomLeft(), rect.bottomRight())
+        painter.drawLine(rect.bottomLeft(), rect.topLeft())
+        if not self.entries:
+            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, "No exports recorded yet.")
+            return
+        peak = max(entry.get("total_seconds", 0.0) for entry in self.entries) or 1.0
+        painter.drawText(0, rect.top() + 10, f"{peak:.0f}s")
+        painter.drawText(0, rect.bottom(), "0s")
+        slot = rect.width() / len(self.entries)
+        bar_width = max(2.0, min(40.0, slot * 0.7))
+        for i, entry in enumerate(self.entries):
+            x = rect.left() + i * slot + (slot - bar_width) / 2
+            y = float(rect.bottom())
+            for name, seconds in entry.get("stages", {}).items():
+                height = rect.height() * seconds / peak
+                y -= height
+                painter.fillRect(int(x), int(y), int(bar_width), max(1, int(height)),
+                                 QColor(STAGE_COLORS.get(name, "#cccccc")))
+        painter.end()
+
+
+class ExportHistoryDialog(QDialog):
+    def __init__(self, project_root, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Export History")
+        entries = load_history(project_root)
+        layout = QVBoxLayout(self)
+        layout.addWidget(ExportHistoryChart(entries))
+        legend = QHBoxLayout()
+        for name, color in STAGE_COLORS.items():
+            label = QLabel(name)
+            label.setStyleSheet(f"color: {color}; font-weight: bold;")
+            legend.addWidget(label)
+        layout.addLayout(legend)
+        table = QPlainTextEdit()
+        table.setReadOnly(True)
+        lines = []
+        for entry in reversed(entries):
+            launch = entry.get("launch_seconds")
+            lines.append("{}  {:<24} {:>8.2f} s  {:>10}  {:<8} launch {:>8}  {} task(s)".format(
+                entry.get("timestamp", "?"), entry.get("name", "?"),
+                entry.get("total_seconds", 0.0), format_size(entry.get("artifact_size", 0)),
+                entry.get("layout", "onefile"), f"{launch:.2f} s" if launch is not None else "-",
+                entry.get("task_count", "?")))
+        table.setPlainText("\n".join(lines) if lines else "No exports recorded yet.")
+        layout.addWidget(table)
+        close_button = QPushButton("Close")
+        close_button.clicked.connect(self.accept)
+        layout.addWidget(close_button)
+        self.resize(720, 520)
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+# builder/footprint.py
+"""
+Bundle footprint analysis: a dry run of the export that builds nothing.
+
+It takes the hidden imports and data files export_exe() would pass to
+PyInstaller, resolves the static import graph of the game script and of
+every hidden import with modulefinder, and reports what each one adds to
+the bundle:
+
+- own: modules only that import brings in. Dropping it saves these bytes.
+- shared: modules it shares with other hidden imports but not with game.py.
+- import: its import time on top of `import game.game`, measured in a fresh
+  interpreter with -X importtime.
+
+Task types the deck never uses are flagged, as are data files that no
+bundled module refers to. Sizes are of Python sources and extension modules;
+native libraries PyInstaller collects alongside them (Qt, OpenSSL) are not
+counted.
+
+    python -m builder.footprint [--no-import-times]
+"""
+import os
+import sys
+import json
+import modulefinder
+from collections import namedtuple
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.abspath(os.path.join(current_dir, ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from PyQt6.QtWidgets import (
+    QApplication, QDialog, QVBoxLayout, QPlainTextEdit, QPushButton, QHBoxLayout, QLabel
+)
+
+from shared.utils import logger
+from shared.utils.import_timing import run_importtime
+from shared.utils.task_discovery import scan_task_modules, normalize_task_type
+from builder.export import get_hidden_imports, get_data_files
+from builder.export_history import format_size
+
+GAME_SCRIPT = os.path.join("game", "game.py")
+IMPORT_SETUP = "import game.game"
+
+BundleItem = namedtuple("BundleItem", [
+    "name", "task_type", "used", "found", "own_modules", "own_bytes",
+    "shared_modules", "shared_bytes", "import_ms"
+])
+DataFile = namedtuple("DataFile", ["path", "size", "referenced_by"])
+Footprint = namedtuple("Footprint", [
+    "base_modules", "base_bytes", "items", "data_files", "unused_task_types", "missing_task_types"
+])
+
+
+class _GraphFinder(modulefinder.ModuleFinder):
+    """ModuleFinder that also records which module imports which."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.edges = {}
+        self._importers = []
+
+    def add_root(self, root, module_name):
+        self._importers.append(root)
+        try:
+            self.import_hook(module_name)
+        finally:
+            self._importers.pop()
+
+    def import_hook(self, name, caller=None, fromlist=None, level=-1):
+        self._importers.append(caller.__name__ if caller is not None else
+                               self._importers[-1] if self._importers else None)
+        try:
+            return super().import_hook(name, caller, fromlist, level)
+        finally:
+            self._importers.pop()
+
+    def import_module(self, partname, fqname, parent):
+        module = super().import_module(partname, fqname, parent)
+        if module is not None and self._importers:
+            self.edges.setdefault(self._importers[-1], set()).add(module.__name__)
+        return module
+
+    def closure(self, root):
+        seen = set()
+        pending = [root]
+        while pending:
+            for name in self.edges.get(pending.pop(), ()):
+                if name not in seen:
+                    seen.add(name)
+                    pending.append(name)
+        return seen
+
+    def module_size(self, name):
+        module = self.modules.get(name)
+        path = getattr(module, "__file__", None)
+        try:
+            return os.path.getsize(path) if path else 0
+        except OSError:
+            return 0
+
+
+def _read_deck_types(project_root):
+    try:
+        with open(os.path.join(project_root, "builder", "tasks", "tasks.json"), "r") as f:
+            tasks = json.load(f)
+    except Exception as e:
+        logger.error("Error reading tasks.json: %s", e)
+        return set()
+    if not isinstance(tasks, list):
+        return set()
+    return {normalize_task_type(task.get("TASK_TYPE", task.get("type", "short_answer"))) for task in tasks}
+
+
+def _import_ms(module_name, project_root):
+    try:
+        records, _ = run_importtime(f"import {module_name}", project_root, setup=IMPORT_SETUP)
+    except Exception as e:
+        logger.warning("Could not time import of %s: %s", module_name, str(e).strip().splitlines()[-1])
+        return None
+    return sum(r.cumulative_us for r in records if r.depth == 0) / 1000
+
+
+def _string_constants(path):
+    import ast
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            tree = ast.parse(f.read(), filename=path)
+    except Exception:
+        return set()
+    return {node.value for node in ast.walk(tree)
+            if isinstance(node, ast.Constant) and isinstance(node.value, str)}
+
+
+def _data_file_references(data_files, finder, bundled, project_root):
+    """
+    Returns a DataFile per --add-data entry with the bundled project modules
+    whose string literals name the file or the folder it is bundled in.
+    """
+    constants = {}
+    for name in bundled:
+        path = getattr(finder.modules.get(name), "__file__", None)
+        if path and os.path.abspath(path).startswith(project_root + os.sep):
+            constants[name] = _string_constants(path)
+    results = []
+    for entry in data_files:
+        path = entry.split(";", 1)[0]
+        rel_path = os.path.relpath(path, project_root).replace("\\", "/")
+        filename = os.path.basename(rel_path)
+        folder = rel_path.rsplit("/", 2)[-2] if "/" in rel_path else ""
+        referenced_by = sorted(
+            name for name, strings in constants.items()
+            if any(filename in s or (folder and (s == folder or folder in s.split("/"))) for s in strings)
+        )
+        results.append(DataFile(rel_path, os.path.getsize(path), referenced_by))
+    return results
+
+
+def analyze_footprint(project_root, measure_imports=True):
+    """Resolves the bundle's dependency graph without building and returns a Footprint."""
+    with logger.span("footprint_analysis", level=logger.INFO):
+        hidden_imports = get_hidden_imports(project_root)
+        data_files = get_data_files(project_root)
+        task_types = {module: task_type for task_type, module in
+                      scan_task_modules(os.path.join(project_root, "shared", "tasks")).items()}
+        deck_types = _read_deck_types(project_root)
+
+        finder = _GraphFinder(path=[project_root] + sys.path)
+        finder.run_script(os.path.join(project_root, GAME_SCRIPT))
+        for name in hidden_imports:
+            finder.add_root("<hidden>" + name, name)
+
+        base = finder.closure("__main__") | {"__main__"}
+        closures = {name: finder.closure("<hidden>" + name) - base for name in hidden_imports}
+        items = []
+        for name in hidden_imports:
+            others = set().union(*(c for other, c in closures.items() if other != name))
+            own = closures[name] - others
+            shared = closures[name] - own
+            task_type = task_types.get(name)
+            items.append(BundleItem(
+                name=name,
+                task_type=task_type,
+                used=task_type is None or task_type in deck_types,
+                found=name in finder.modules,
+                own_modules=sorted(own),
+                own_bytes=sum(finder.module_size(m) for m in own),
+                shared_modules=sorted(shared),
+                shared_bytes=sum(finder.module_size(m) for m in shared),
+                import_ms=_import_ms(name, project_root) if measure_imports else None,
+            ))
+
+        bundled = base.union(*closures.values())
+        footprint = Footprint(
+            base_modules=len(base),
+            base_bytes=sum(finder.module_size(m) for m in base),
+            items=items,
+            data_files=_data_file_references(data_files, finder, bundled, os.path.abspath(project_root)),
+            unused_task_types=sorted(item.task_type for item in items if not item.used),
+            missing_task_types=sorted(deck_types - set(task_types.values())),
+        )
+    return footprint
+
+
+def format_footprint(footprint):
+    """Returns a plain-text report of a Footprint."""
+    items = sorted(footprint.items, key=lambda i: (i.task_type is None, -i.own_bytes, i.name))
+    lines = ["Bundle Footprint (dry run, nothing was built):", "",
+             f"game.py and its imports: {footprint.base_modules} modules, {format_size(footprint.base_bytes)}", "",
+             "Hidden imports (own = only this import needs it, shared = with other hidden imports;",
+             "import = time on top of `import game.game`):",
+             f"  {'own':>10}  {'shared':>10}  {'import':>9}  module"]
+    for item in items:
+        import_ms = f"{item.import_ms:7.1f}ms" if item.import_ms is not None else f"{'-':>9}"
+        flags = []
+        if item.task_type:
+            flags.append(f"task type {item.task_type}" + ("" if item.used else ", NOT USED BY THE DECK"))
+        if not item.found:
+            flags.append("NOT FOUND")
+        lines.append(f"  {format_size(item.own_bytes):>10}  {format_size(item.shared_bytes):>10}  {import_ms}  "
+                     f"{item.name}" + (f"  [{'; '.join(flags)}]" if flags else ""))
+        extra = [m for m in item.own_modules if m != item.name]
+        if extra:
+            shown = ", ".join(extra[:8]) + (f", ... ({len(extra) - 8} more)" if len(extra) > 8 else "")
+            lines.append(f"  {'':>10}  {'':>10}  {'':>9}    pulls in: {shown}")
+
+    lines += ["", "Data files (--add-data):"]
+    for data_file in footprint.data_files:
+        users = ", ".join(data_file.referenced_by) if data_file.referenced_by else "NOT REFERENCED BY ANY BUNDLED MODULE"
+        lines.append(f"  {format_size(data_file.size):>10}  {data_file.path}  ({users})")
+    if not footprint.data_files:
+        lines.append("  none")
+
+    lines.append("")
+    unused = [i for i in footprint.items if not i.used]
+    if unused:
+        saving = sum(i.own_bytes for i in unused)
+        lines.append(f"Task types the deck never uses: {', '.join(footprint.unused_task_types)} "
+                     f"({format_size(saving)} of modules only they need)")
+    else:
+        lines.append("The deck uses every bundled task type.")
+    unreferenced = [d for d in footprint.data_files if not d.referenced_by]
+    if unreferenced:
+        lines.append(f"Data files no bundled module refers to: {len(unreferenced)} "
+                     f"({format_size(sum(d.size for d in unreferenced))})")
+    if footprint.missing_task_types:
+        lines.append("Task types used by the deck with no task module: " + ", ".join(footprint.missing_task_types))
+    return "\n".join(lines)
+
+
+class FootprintDialog(QDialog):
+    def __init__(self, report, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Export Dry Run")
+        layout = QVBoxLayout(self)
+        layout.addWidget(QLabel("Bundle footprint (no EXE was built)"))
+        text_box = QPlainTextEdit()
+        text_box.setPlainText(report)
+        text_box.setReadOnly(True)
+        layout.addWidget(text_box)
+        button_layout = QHBoxLayout()
+        copy_button = QPushButton("Copy Report")
+        copy_button.clicked.connect(lambda: QApplication.clipboard().setText(report))
+        close_button = QPushButton("Close")
+        close_button.clicked.connect(self.accept)
+        button_layout.addWidget(copy_button)
+        button_layout.addWidget(close_button)
+        layout.addLayout(button_layout)
+        self.resize(820, 520)
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Report what an export would bundle, without building it.")
+    parser.add_argument("--no-import-times", action="store_true", help="Skip measuring import times")
+    args = parser.parse_args()
+    print(format_footprint(analyze_footprint(PROJECT_ROOT, measure_imports=not args.no_import_times)))
@@ -3,23 +3,14 @@ import sys
 import json
 import random
 
-def get_project_root():
-    return os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-
-def get_data_path(relative_path):
-    if getattr(sys, "frozen", False):
-        return os.path.join(sys._MEIPASS, relative_path)
-    else:
-        return os.path.join(get_project_root(), relative_path)
+from shared.utils import logger
+from shared.utils.data_helpers import get_data_path, load_json_resource
 
 def load_config():
-    config_path = get_data_path(os.path.join("builder", "config.json"))
     try:
-        with open(config_path, "r") as f:
-            config = json.load(f)
-        return config
+        return load_json_resource("builder/config.json")
     except Exception as e:
-        print("Error loading config: {}".format(e))
+        logger.error("Error loading config: %s", e)
         return {}
 
 def save_config(config):
@@ -27,9 +18,9 @@ def save_config(config):
     try:
         with open(config_path, "w") as f:
             json.dump(config, f, indent=4)
-        print("Config saved successfully.")
+        logger.info("Config saved successfully.")
     except Exception as e:
-        print("Error saving config: {}".format(e))
+        logger.error("Error saving config: %s", e)
 
 def load_gift_cards():
     gift_card_path = get_data_path(os.path.join("builder", "data", "gift_cards"))
@@ -43,11 +34,11 @@ def load_gift_cards():
                     if isinstance(data, dict) and "name" in data:
                         gift_cards[data["name"]] = data
                     else:
-                        print("Skipping {}: Missing or invalid 'name' field.".format(file))
+                        logger.warning("Skipping %s: Missing or invalid 'name' field.", file)
                 except Exception as e:
-                    print("Error loading {}: {}".format(file, e))
+                    logger.error("Error loading %s: %s", file, e)
     else:
-        print("Gift card folder not found: {}".format(gift_card_path))
+        logger.warning("Gift card folder not found: %s", gift_card_path)
     return gift_cards
 
 def generate_random_code(card_data):
@@ -92,10 +83,10 @@ def update_final_gift_card(selected_name, custom_data=None):
     if getattr(sys, "frozen", False):
         try:
             from builder.static_manifest import GIFT_CARD_STATIC
-            print("DEBUG: Using static gift card data:", GIFT_CARD_STATIC)
+            logger.debug("Using static gift card data: %s", GIFT_CARD_STATIC)
             return GIFT_CARD_STATIC
         except Exception as e:
-            print("Error loading static gift card from manifest:", e)
+            logger.warning("Error loading static gift card from manifest: %s", e)
     config = load_config()
     if selected_name == "Custom Gift Card":
         if custom_data is None:
@@ -105,7 +96,7 @@ def update_final_gift_card(selected_name, custom_data=None):
         gift_cards = load_gift_cards()
         card_data = gift_cards.get(selected_name)
         if not card_data:
-            print("Gift card '{}' not found. Using default parameters.".format(selected_name))
+            logger.warning("Gift card '%s' not found. Using default parameters.", selected_name)
             card_data = {
                 "format": "4-4-4-4",
                 "pin_format": "4",
@@ -0,0 +1,96 @@
+# builder/preview.py
+"""
+Live game preview for the builder.
+
+Runs the GameUI task flow in-process against the builder's in-memory deck,
+with every system-level lockdown feature forced off, so a deck can be played
+without an export. Deck edits are hot-reloaded after a short debounce; the
+preview reopens at the task it was showing.
+"""
+import copy
+
+from PyQt6.QtCore import QObject, QTimer
+
+from builder.gift_card import load_config
+from shared.utils import logger
+
+RELOAD_DEBOUNCE_MS = 400
+
+# Shown instead of a looked-up location: location_collection tasks without
+# an answer would otherwise make blocking HTTP calls on every reload.
+PREVIEW_LOCATION = "Your City, Region, Country (detected at runtime)"
+
+
+def preview_gift_card():
+    gift = load_config().get("selected_gift_card", {})
+    return {
+        "code": gift.get("code") or "XXXX-XXXX-XXXX",
+        "pin": gift.get("pin", "----"),
+        "name": gift.get("name", "Gift Card"),
+        "pin_required": gift.get("pin_required", True)
+    }
+
+
+def preview_tasks(tasks):
+    """Returns a copy of the deck that can be played without network lookups."""
+    tasks = copy.deepcopy(tasks)
+    for task in tasks:
+        task_type = task.get("TASK_TYPE", task.get("type"))
+        if task_type == "location_collection" and not task.get("answer"):
+            task["answer"] = PREVIEW_LOCATION
+    return tasks
+
+
+class GamePreview(QObject):
+    def __init__(self, get_tasks, parent=None):
+        """get_tasks: callable returning the builder's current deck."""
+        super().__init__(parent)
+        self.get_tasks = get_tasks
+        self.window = None
+        self.reload_timer = QTimer(self)
+        self.reload_timer.setSingleShot(True)
+        self.reload_timer.setInterval(RELOAD_DEBOUNCE_MS)
+        self.reload_timer.timeout.connect(self.reload)
+
+    def is_open(self):
+        return self.window is not None and self.window.isVisible()
+
+    def open(self):
+        if self.is_open():
+            self.window.raise_()
+            self.window.activateWindow()
+            return
+        self._show(start_index=0)
+
+    def schedule_reload(self):
+        """Called on every deck change; rebuilds the preview once edits settle."""
+        if self.is_open():
+            self.reload_timer.start()
+
+    def reload(self):
+        if not self.is_open():
+            return
+        index = self.window.current_task_index
+        geometry = self.window.geometry()
+        self.close()
+        self._show(start_index=index, geometry=geometry)
+
+    def close(self):
+        self.reload_timer.stop()
+        if self.window is not None:
+            self.window.close()
+            self.window.deleteLater()
+            self.window = None
+
+    def _show(self, start_index, geometry=None):
+        # Imported lazily: the game module is only needed once a preview opens.
+        from game.game import GameUI
+        from game.runtime_config import load_runtime_config, UNLOCKED_SETTINGS
+        with logger.span("preview.load", level=logger.INFO):
+            config = load_runtime_config(tasks=preview_tasks(self.get_tasks()), settings=UNLOCKED_SETTINGS,
+                                         gift_card=preview_gift_card())
+            self.window = GameUI(config, start_index=start_index)
+        self.window.setWindowTitle("Deck Preview")
+        if geometry is not None:
+            self.window.setGeometry(geometry)
+        self.window.show()
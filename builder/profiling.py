@@ -0,0 +1,143 @@
+# builder/profiling.py
+"""
+In-process profiling for the builder, shown in the Developer Zone's
+Performance panel.
+
+- timed(name): context manager that records how long a builder operation
+  took (form loads, saves, discovery, ...). get_timings() summarises them.
+- ActionProfiler: once armed, runs cProfile over the next user action (the
+  next click or key press anywhere in the builder) and reports the hotspots.
+"""
+import time
+import pstats
+import cProfile
+from collections import OrderedDict, namedtuple
+
+from PyQt6.QtCore import QObject, QEvent, QTimer, pyqtSignal
+from PyQt6.QtWidgets import QApplication, QWidget
+
+from shared.utils import logger
+
+OperationTiming = namedtuple("OperationTiming", ["name", "count", "last", "mean", "max"])
+Hotspot = namedtuple("Hotspot", ["function", "calls", "own_seconds", "cumulative_seconds"])
+
+# name -> [count, last, total, max]
+_timings = OrderedDict()
+
+
+class timed:
+    """
+    Times a builder operation: `with timed("task_form.load"): ...`. The block
+    is logged as a span named prefix + name and its duration passed to
+    record_to (the builder's timings by default; export stages pass their
+    StageTimer's add).
+    """
+
+    def __init__(self, name, prefix="builder.", level=logger.DEBUG, record_to=None, **fields):
+        self.name = name
+        self.prefix = prefix
+        self.level = level
+        self.record_to = record_to
+        self.fields = fields
+
+    def __enter__(self):
+        self.span = logger.span(self.prefix + self.name, level=self.level, **self.fields)
+        self.span.__enter__()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        (self.record_to or record)(self.name, time.perf_counter() - self.start)
+        return self.span.__exit__(exc_type, exc, tb)
+
+
+def record(name, seconds):
+    stats = _timings.get(name)
+    if stats is None:
+        _timings[name] = [1, seconds, seconds, seconds]
+    else:
+        stats[0] += 1
+        stats[1] = seconds
+        stats[2] += seconds
+        stats[3] = max(stats[3], seconds)
+
+
+def get_timings():
+    """Returns an OperationTiming (seconds) per operation, in first-seen order."""
+    return [OperationTiming(name, count, last, total / count, peak)
+            for name, (count, last, total, peak) in _timings.items()]
+
+
+def reset_timings():
+    _timings.clear()
+
+
+def hotspots(profile, limit=40, sort="cumulative"):
+    """Returns the top `limit` Hotspot rows of a cProfile.Profile."""
+    stats = pstats.Stats(profile)
+    rows = []
+    for (filename, line, func), (_, ncalls, tottime, cumtime, _) in stats.stats.items():
+        if filename == "~":
+            label = func  # Built-in function.
+        else:
+            label = f"{func} ({filename.replace(chr(92), '/').rsplit('/', 1)[-1]}:{line})"
+        rows.append(Hotspot(label, ncalls, tottime, cumtime))
+    key = (lambda r: r.own_seconds) if sort == "own" else (lambda r: r.cumulative_seconds)
+    return sorted(rows, key=key, reverse=True)[:limit]
+
+
+class ActionProfiler(QObject):
+    """
+    Profiles the next user action. arm() installs an application-wide event
+    filter; the next mouse release or key press on a widget starts cProfile,
+    which stops once control is back in an event loop (an action that opens
+    a modal dialog is profiled up to the dialog appearing). Then
+    captured(label, hotspots, seconds) is emitted.
+    """
+    captured = pyqtSignal(str, list, float)
+
+    TRIGGER_EVENTS = (QEvent.Type.MouseButtonRelease, QEvent.Type.KeyPress)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.armed = False
+        self.profile = None
+        self.label = ""
+
+    def arm(self):
+        if self.armed:
+            return
+        self.armed = True
+        QApplication.instance().installEventFilter(self)
+
+    def disarm(self):
+        if self.armed:
+            QApplication.instance().removeEventFilter(self)
+            self.armed = False
+
+    def eventFilter(self, obj, event):
+        if (self.armed and self.profile is None and isinstance(obj, QWidget)
+                and event.type() in self.TRIGGER_EVENTS):
+            self.disarm()
+            self.label = _describe(obj, event)
+            self.profile = cProfile.Profile()
+            self.start = time.perf_counter()
+            self.profile.enable()
+            QTimer.singleShot(0, self._finish)
+        return False
+
+    def _finish(self):
+        profile, self.profile = self.profile, None
+        if profile is None:
+            return
+        profile.disable()
+        elapsed = time.perf_counter() - self.start
+        logger.info("Profiled %s in %.3f s", self.label, elapsed)
+        self.captured.emit(self.label, hotspots(profile), elapsed)
+
+
+def _describe(obj, event):
+    kind = "key press" if event.type() == QEvent.Type.KeyPress else "click"
+    text = obj.text() if hasattr(obj, "text") and callable(obj.text) else ""
+    name = type(obj).__name__
+    return f"{kind} on {name} '{text}'" if text else f"{kind} on {name}"
@@ -1,14 +1,29 @@
 # builder/task_builder.py
 import os
+import re
+import copy
 import json
+from collections import deque
+from contextlib import contextmanager
 from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import QListWidget, QListWidgetItem
 
 # Import from utils, not from builder.py
 from builder.utils import normalize_task_type, display_task_type
+from builder.validation import convert_task
+
+# Number of deck edits that can be undone.
+JOURNAL_LIMIT = 50
+
 
 class TaskListWidget(QListWidget):
-    pass
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setSelectionMode(QListWidget.SelectionMode.ExtendedSelection)
+
+    def selected_rows(self):
+        return sorted(self.row(item) for item in self.selectedItems())
+
 
 class TaskManager:
     def __init__(self, project_root, list_widget: TaskListWidget):
@@ -16,50 +31,74 @@ class TaskManager:
         self.list_widget = list_widget
         self.tasks_file = os.path.join(self.project_root, "builder", "tasks", "tasks.json")
         self.tasks = []
+        self.listeners = []
+        # (label, deck before the edit, saved) for every edit, most recent last.
+        # saved is True for bulk edits, which write tasks.json themselves.
+        self.journal = deque(maxlen=JOURNAL_LIMIT)
+        # Keep self.tasks in step with drag-and-drop reordering in the list.
+        self.list_widget.model().rowsMoved.connect(lambda *args: self.sync_from_list_widget())
         self.load_tasks()
 
+    def add_listener(self, callback):
+        """Registers a callback invoked with no arguments whenever the deck changes."""
+        self.listeners.append(callback)
+
+    def notify(self):
+        for callback in self.listeners:
+            callback()
+
+    def _record(self, label, saved=False):
+        self.journal.append((label, copy.deepcopy(self.tasks), saved))
+
+    def sync_from_list_widget(self):
+        self._record("Reorder tasks")
+        self.tasks = [self.list_widget.item(i).data(Qt.ItemDataRole.UserRole)
+                      for i in range(self.list_widget.count())]
+        self.notify()
+
     def load_tasks(self):
         if os.path.exists(self.tasks_file):
             try:
                 with open(self.tasks_file, "r") as f:
                     self.tasks = json.load(f)
                 for task in self.tasks:
-                    if "type" in task:
-                        task["TASK_TYPE"] = normalize_task_type(task.pop("type"))
-                    elif "TASK_TYPE" in task:
-                        task["TASK_TYPE"] = normalize_task_type(task["TASK_TYPE"])
+                    _normalize(task)
             except Exception as e:
                 print("Error loading tasks:", e)
                 self.tasks = []
         else:
             self.tasks = []
+        self.journal.clear()
         self.update_list_widget()
+        self.notify()
 
     def update_list_widget(self):
+        """Rebuilds the whole list; single and bulk edits update items in place instead."""
+        self.list_widget.setUpdatesEnabled(False)
         self.list_widget.clear()
         for task in self.tasks:
-            norm_type = task.get("TASK_TYPE", "unknown_task")
-            display_text = display_task_type(norm_type)
-            item = QListWidgetItem(display_text)
-            item.setData(Qt.ItemDataRole.UserRole, task)
-            self.list_widget.addItem(item)
+            self.list_widget.addItem(_make_item(task))
+        self.list_widget.setUpdatesEnabled(True)
 
     def add_task(self, task):
-        if "type" in task:
-            task["TASK_TYPE"] = normalize_task_type(task.pop("type"))
-        elif "TASK_TYPE" in task:
-            task["TASK_TYPE"] = normalize_task_type(task["TASK_TYPE"])
+        _normalize(task)
+        self._record("Add task")
         self.tasks.append(task)
-        self.update_list_widget()
+        self.list_widget.addItem(_make_item(task))
+        self.notify()
 
     def delete_task(self, index):
         if 0 <= index < len(self.tasks):
+            self._record("Delete task")
             del self.tasks[index]
-            self.update_list_widget()
+            self.list_widget.takeItem(index)
+            self.notify()
 
     def clear_tasks(self):
+        self._record("Clear tasks")
         self.tasks = []
         self.update_list_widget()
+        self.notify()
 
     def save_tasks(self):
         try:
@@ -68,3 +107,156 @@ class TaskManager:
             print("Tasks saved successfully.")
         except Exception as e:
             print("Error saving tasks:", e)
+
+    # -------------- Bulk edits --------------
+    @contextmanager
+    def batch(self, label):
+        """
+        Groups a bulk edit: the list widget repaints once, and on success the
+        edit gets one journal entry, one notification and one save. Edits
+        inside the block update list items in place.
+        """
+        before = copy.deepcopy(self.tasks)
+        self.list_widget.setUpdatesEnabled(False)
+        try:
+            yield
+        except Exception:
+            self.tasks = before
+            self.update_list_widget()
+            raise
+        finally:
+            self.list_widget.setUpdatesEnabled(True)
+        self.journal.append((label, before, True))
+        self.notify()
+        self.save_tasks()
+
+    def can_undo(self):
+        return bool(self.journal)
+
+    def undo(self):
+        """
+        Reverts the most recent edit and returns its label, or None. Only the
+        undo of a bulk edit is saved, as the edit itself was.
+        """
+        if not self.journal:
+            return None
+        label, before, saved = self.journal.pop()
+        self.tasks = before
+        self.update_list_widget()
+        self.notify()
+        if saved:
+            self.save_tasks()
+        return label
+
+    def _select_rows(self, rows):
+        self.list_widget.clearSelection()
+        for row in rows:
+            self.list_widget.item(row).setSelected(True)
+
+    def delete_tasks(self, rows):
+        rows = sorted({r for r in rows if 0 <= r < len(self.tasks)}, reverse=True)
+        if not rows:
+            return 0
+        with self.batch(f"Delete {len(rows)} task(s)"):
+            for row in rows:
+                del self.tasks[row]
+                self.list_widget.takeItem(row)
+        return len(rows)
+
+    def duplicate_tasks(self, rows):
+        """Inserts a copy of each task right after the last selected one."""
+        rows = sorted({r for r in rows if 0 <= r < len(self.tasks)})
+        if not rows:
+            return 0
+        with self.batch(f"Duplicate {len(rows)} task(s)"):
+            position = rows[-1] + 1
+            copies = [copy.deepcopy(self.tasks[r]) for r in rows]
+            self.tasks[position:position] = copies
+            for offset, task in enumerate(copies):
+                self.list_widget.insertItem(position + offset, _make_item(task))
+            self._select_rows(range(position, position + len(copies)))
+        return len(rows)
+
+    def move_tasks(self, rows, position):
+        """
+        Moves the tasks at rows, keeping their order, so the first of them
+        ends up at position (0-based, in the list without them).
+        """
+        rows = sorted({r for r in rows if 0 <= r < len(self.tasks)})
+        if not rows:
+            return 0
+        with self.batch(f"Move {len(rows)} task(s)"):
+            moving = [self.tasks[r] for r in rows]
+            items = []
+            for row in reversed(rows):
+                del self.tasks[row]
+                items.append(self.list_widget.takeItem(row))
+            items.reverse()
+            position = max(0, min(position, len(self.tasks)))
+            self.tasks[position:position] = moving
+            for offset, item in enumerate(items):
+                self.list_widget.insertItem(position + offset, item)
+            self._select_rows(range(position, position + len(items)))
+        return len(rows)
+
+    def change_type(self, rows, task_type, module_import):
+        """
+        Converts the tasks at rows to task_type where their fields satisfy the
+        target schema. Returns (converted count, [(1-based row, problem)]).
+        """
+        converted, skipped = [], []
+        for row in sorted({r for r in rows if 0 <= r < len(self.tasks)}):
+            if self.tasks[row].get("TASK_TYPE") == task_type:
+                continue
+            task, problems = convert_task(self.tasks[row], task_type, module_import)
+            if problems:
+                skipped.append((row + 1, problems[0]))
+            else:
+                converted.append((row, task))
+        if converted:
+            with self.batch(f"Change {len(converted)} task(s) to {display_task_type(task_type)}"):
+                for row, task in converted:
+                    self.tasks[row] = task
+                    _update_item(self.list_widget.item(row), task)
+        return len(converted), skipped
+
+    def find_replace(self, find, replace, rows=None, match_case=False):
+        """
+        Replaces find with replace in the question text of the tasks at rows
+        (all tasks if rows is None). Returns the number of tasks changed.
+        """
+        if not find:
+            return 0
+        pattern = re.compile(re.escape(find), 0 if match_case else re.IGNORECASE)
+        candidates = range(len(self.tasks)) if rows is None else sorted(set(rows))
+        changes = []
+        for row in candidates:
+            question = self.tasks[row].get("question")
+            if isinstance(question, str):
+                updated = pattern.sub(lambda m: replace, question)
+                if updated != question:
+                    changes.append((row, updated))
+        if changes:
+            with self.batch(f"Replace '{find}' in {len(changes)} task(s)"):
+                for row, question in changes:
+                    self.tasks[row]["question"] = question
+                    _update_item(self.list_widget.item(row), self.tasks[row])
+        return len(changes)
+
+
+def _normalize(task):
+    if "type" in task:
+        task["TASK_TYPE"] = normalize_task_type(task.pop("type"))
+    elif "TASK_TYPE" in task:
+        task["TASK_TYPE"] = normalize_task_type(task["TASK_TYPE"])
+
+
+def _make_item(task):
+    item = QListWidgetItem()
+    _update_item(item, task)
+    return item
+
+
+def _update_item(item, task):
+    item.setText(display_task_type(task.get("TASK_TYPE", "unknown_task")))
+    item.setData(Qt.ItemDataRole.UserRole, task)
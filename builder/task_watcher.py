@@ -0,0 +1,64 @@
+# builder/task_watcher.py
+"""
+Watches shared/tasks for edited, added and removed task modules while the
+builder is running, so the builder can reload just those modules instead of
+being restarted.
+"""
+import os
+import glob
+
+from PyQt6.QtCore import QObject, QTimer, QFileSystemWatcher, pyqtSignal
+
+# Editors often write a file several times per save; wait for them to settle.
+WATCH_DEBOUNCE_MS = 300
+
+
+def _snapshot(folder):
+    snapshot = {}
+    for filepath in glob.glob(os.path.join(folder, "*.py")):
+        if os.path.basename(filepath) == "__init__.py":
+            continue
+        try:
+            snapshot[filepath] = os.path.getmtime(filepath)
+        except OSError:
+            pass
+    return snapshot
+
+
+class TaskModuleWatcher(QObject):
+    # (changed_or_added_paths, removed_paths)
+    modulesChanged = pyqtSignal(list, list)
+
+    def __init__(self, folder, parent=None):
+        super().__init__(parent)
+        self.folder = folder
+        self.mtimes = _snapshot(folder)
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.directoryChanged.connect(self.schedule_scan)
+        self.watcher.fileChanged.connect(self.schedule_scan)
+        self.scan_timer = QTimer(self)
+        self.scan_timer.setSingleShot(True)
+        self.scan_timer.setInterval(WATCH_DEBOUNCE_MS)
+        self.scan_timer.timeout.connect(self.scan)
+        self._rewatch()
+
+    def _rewatch(self):
+        # Editors that save by replacing the file drop the old watch, so
+        # re-add every current path after each scan.
+        paths = [self.folder] + list(self.mtimes)
+        watched = set(self.watcher.files()) | set(self.watcher.directories())
+        missing = [p for p in paths if p not in watched]
+        if missing:
+            self.watcher.addPaths(missing)
+
+    def schedule_scan(self, *args):
+        self.scan_timer.start()
+
+    def scan(self):
+        current = _snapshot(self.folder)
+        changed = sorted(p for p, mtime in current.items() if self.mtimes.get(p) != mtime)
+        removed = sorted(p for p in self.mtimes if p not in current)
+        self.mtimes = current
+        self._rewatch()
+        if changed or removed:
+            self.modulesChanged.emit(changed, removed)
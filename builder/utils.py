@@ -1,6 +1,6 @@
 # builder/utils.py
-def normalize_task_type(task_type: str) -> str:
-    return task_type.lower().replace(" ", "_")
+# normalize_task_type lives with task discovery, which the game uses too.
+from shared.utils.task_discovery import normalize_task_type
 
 def display_task_type(normalized_type: str) -> str:
     return " ".join(word.capitalize() for word in normalized_type.split("_"))
@@ -0,0 +1,223 @@
+# builder/validation.py
+"""
+Deck validation for the builder.
+
+Each task module in shared/tasks declares a TASK_SCHEMA dict describing the
+fields its saved data must carry. Schemas are compiled once per task type into
+a list of check functions, and validation results are cached by the deck's
+content hash so an unchanged deck is never revalidated.
+
+Schema field options:
+    type           expected Python type (str, list, bool, int)
+    required       field must be present (default False)
+    items          expected type of every list item
+    min_items      minimum list length
+    index_of       list of ints that must index into another list field
+    non_empty_when list must be non-empty when the named field is truthy
+"""
+import hashlib
+import importlib
+import json
+from collections import OrderedDict
+
+from builder.utils import normalize_task_type, display_task_type
+
+# Compiled validators, keyed by normalized task type.
+_compiled = {}
+# Validation results keyed by (deck hash, known task types), most recent last.
+_results = OrderedDict()
+_RESULTS_MAX = 32
+
+_TYPE_NAMES = {str: "string", list: "list", bool: "boolean", int: "integer", dict: "object"}
+
+
+def _type_name(t):
+    return _TYPE_NAMES.get(t, t.__name__)
+
+
+def _is_type(value, expected):
+    # bool is a subclass of int; never accept it where an integer is expected.
+    if expected is int and isinstance(value, bool):
+        return False
+    return isinstance(value, expected)
+
+
+def _compile_field(name, rules):
+    checks = []
+    expected = rules.get("type")
+    if rules.get("required", False):
+        def check_required(task):
+            if name not in task:
+                return f"missing required field '{name}'"
+        checks.append(check_required)
+    if expected is not None:
+        def check_type(task):
+            if name in task and not _is_type(task[name], expected):
+                return f"field '{name}' must be a {_type_name(expected)}"
+        checks.append(check_type)
+    items = rules.get("items")
+    if items is not None:
+        def check_items(task):
+            value = task.get(name)
+            if isinstance(value, list):
+                for i, item in enumerate(value):
+                    if not _is_type(item, items):
+                        return f"field '{name}' item {i} must be a {_type_name(items)}"
+        checks.append(check_items)
+    min_items = rules.get("min_items")
+    if min_items is not None:
+        def check_min_items(task):
+            value = task.get(name)
+            if isinstance(value, list) and len(value) < min_items:
+                return f"field '{name}' needs at least {min_items} item(s), has {len(value)}"
+        checks.append(check_min_items)
+    index_of = rules.get("index_of")
+    if index_of is not None:
+        def check_index_of(task):
+            value = task.get(name)
+            target = task.get(index_of)
+            if isinstance(value, list) and isinstance(target, list):
+                bad = [v for v in value if _is_type(v, int) and not 0 <= v < len(target)]
+                if bad:
+                    return f"field '{name}' has out-of-range indices {bad} for {len(target)} '{index_of}'"
+        checks.append(check_index_of)
+    non_empty_when = rules.get("non_empty_when")
+    if non_empty_when is not None:
+        def check_non_empty_when(task):
+            value = task.get(name)
+            if task.get(non_empty_when) and isinstance(value, list) and not value:
+                return f"field '{name}' must not be empty when '{non_empty_when}' is set"
+        checks.append(check_non_empty_when)
+    return checks
+
+
+def compile_schema(schema):
+    """
+    Compiles a TASK_SCHEMA dict into a validator function.
+    The validator takes a task dict and returns a list of problem strings.
+    """
+    checks = []
+    for name, rules in schema.items():
+        checks.extend(_compile_field(name, rules))
+
+    def validate(task):
+        problems = []
+        for check in checks:
+            problem = check(task)
+            if problem:
+                problems.append(problem)
+        return problems
+    return validate
+
+
+def get_validator(task_type, module_import):
+    """
+    Returns the compiled validator for a task type, compiling its module's
+    TASK_SCHEMA on first use. Task types without a schema validate as OK.
+    """
+    validator = _compiled.get(task_type)
+    if validator is None:
+        module = importlib.import_module(module_import)
+        validator = compile_schema(getattr(module, "TASK_SCHEMA", {}))
+        _compiled[task_type] = validator
+    return validator
+
+
+# Fields that mean the same thing in every task type; they are the only ones
+# a type change carries over.
+SHARED_FIELDS = ("question",)
+# Written for the target type's optional fields, so the game does not fall
+# back to its Task class defaults (e.g. short_answer's sample answers).
+_NEUTRAL_VALUES = {str: "", list: [], bool: False, int: 0}
+
+
+def _has_data(value):
+    return value not in (None, "", [], {}, False)
+
+
+def convert_task(task, task_type, module_import):
+    """
+    Converts a task to another task type. SHARED_FIELDS are kept, the target
+    TASK_SCHEMA's other optional fields get neutral values, and any other
+    field that holds data is reported rather than dropped (all fields are
+    kept if the target has no schema). Returns (converted task, problems);
+    the conversion is only valid when problems is empty.
+    """
+    schema = getattr(importlib.import_module(module_import), "TASK_SCHEMA", {})
+    if not schema:
+        converted = {name: value for name, value in task.items() if name not in ("type", "TASK_TYPE")}
+        converted["TASK_TYPE"] = task_type
+        return converted, get_validator(task_type, module_import)(converted)
+    converted = {name: task[name] for name in SHARED_FIELDS if name in task and name in schema}
+    for name, rules in schema.items():
+        if name not in converted and not rules.get("required") and rules.get("type") in _NEUTRAL_VALUES:
+            converted[name] = list(_NEUTRAL_VALUES[list]) if rules["type"] is list else _NEUTRAL_VALUES[rules["type"]]
+    converted["TASK_TYPE"] = task_type
+    problems = [f"{name}: would be lost converting to {display_task_type(task_type)}"
+                for name, value in task.items()
+                if name not in SHARED_FIELDS and name not in ("type", "TASK_TYPE") and _has_data(value)]
+    return converted, problems + get_validator(task_type, module_import)(converted)
+
+
+def invalidate(task_type=None):
+    """Drops compiled validators (all, or a single task type) and cached results."""
+    if task_type is None:
+        _compiled.clear()
+    else:
+        _compiled.pop(task_type, None)
+    _results.clear()
+
+
+def deck_hash(tasks):
+    """Returns a content hash of the deck that is stable across key ordering."""
+    payload = json.dumps(tasks, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def validate_tasks(tasks, task_modules):
+    """
+    Validates a whole deck against the schemas of the discovered task modules.
+
+    tasks: list of task dicts as stored in tasks.json
+    task_modules: dict mapping normalized TASK_TYPE -> module import path
+    Returns a list of (task_index, message) tuples; an empty list means the
+    deck is valid. Task indices are 1-based to match the builder's list.
+    """
+    key = (deck_hash(tasks), tuple(sorted(task_modules.items())))
+    cached = _results.get(key)
+    if cached is not None:
+        _results.move_to_end(key)
+        return list(cached)
+    problems = []
+    if not isinstance(tasks, list):
+        problems.append((0, "deck must be a list of tasks"))
+    else:
+        for idx, task in enumerate(tasks, start=1):
+            if not isinstance(task, dict):
+                problems.append((idx, "task must be an object"))
+                continue
+            raw_type = task.get("TASK_TYPE", task.get("type"))
+            if not isinstance(raw_type, str) or not raw_type:
+                problems.append((idx, "missing TASK_TYPE"))
+                continue
+            task_type = normalize_task_type(raw_type)
+            module_import = task_modules.get(task_type)
+            if module_import is None:
+                problems.append((idx, f"unknown TASK_TYPE '{raw_type}'"))
+                continue
+            try:
+                validator = get_validator(task_type, module_import)
+            except Exception as e:
+                problems.append((idx, f"could not load schema for '{task_type}': {e}"))
+                continue
+            for message in validator(task):
+                problems.append((idx, message))
+    _results[key] = tuple(problems)
+    if len(_results) > _RESULTS_MAX:
+        _results.popitem(last=False)
+    return problems
+
+
+def format_problems(problems):
+    """Formats validation problems as one line per problem for dialogs and reports."""
+    return "\n".join(f"Task {idx}: {message}" if idx else message for idx, message in problems)
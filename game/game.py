@@ -8,126 +8,30 @@ PROJECT_ROOT = os.path.abspath(os.path.join(current_dir, ".."))
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
-# Import get_data_path from shared utils; provide fallback if not found.
-try:
-    from shared.utils.data_helpers import get_data_path
-except ImportError:
-    def get_data_path(relative_path):
-        return os.path.join(PROJECT_ROOT, relative_path)
-
-import json
 import importlib
-import glob
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QLabel,
     QPushButton, QLineEdit, QMessageBox
 )
-from PyQt6.QtCore import Qt, QEvent, QObject
+from PyQt6.QtCore import Qt, QEvent, QObject, QTimer
 
-# --- Dynamic Security Settings Loader ---
-CONFIG_PATH = os.path.join(PROJECT_ROOT, "builder", "config.json")
+from shared.utils import logger
+# Every runtime input (settings, gift card, task manifest, deck, stylesheet)
+# is resolved once at boot into an immutable RuntimeConfig.
+from game.runtime_config import get_runtime_config, UNLOCKED_SETTINGS
 
-def load_security_settings():
-    import sys
-    # If running frozen, load security settings from the static manifest.
-    if getattr(sys, "frozen", False):
-        try:
-            from builder.static_manifest import SECURITY_SETTINGS_STATIC
-            print("DEBUG: Loaded security settings from static manifest:", SECURITY_SETTINGS_STATIC)
-            return SECURITY_SETTINGS_STATIC
-        except Exception as e:
-            print("DEBUG: Error loading security settings from static manifest:", e)
-            # Fall back to reading config.json below.
-    # Dynamic (development) mode: load from config.json.
-    defaults = {
-        "USE_UI_KEYBOARD": True,
-        "KEYBOARD_BLOCKER_MODE": 1,
-        "ENABLE_MOUSE_LOCKER": False,
-        "ENABLE_SLEEP_BLOCKER": False,
-        "ENABLE_SECURITY_MONITOR": False,
-        "CLOSE_BUTTON_DISABLED": False,
-        "ENABLE_LOGGER": True
-    }
-    if os.path.exists(CONFIG_PATH):
-        try:
-            with open(CONFIG_PATH, "r") as f:
-                config = json.load(f)
-                defaults.update(config)
-        except Exception as e:
-            print("Error reading config.json:", e)
-    return defaults
-
-settings = load_security_settings()
-USE_UI_KEYBOARD = settings["USE_UI_KEYBOARD"]
-KEYBOARD_BLOCKER_MODE = settings["KEYBOARD_BLOCKER_MODE"]
-ENABLE_MOUSE_LOCKER = settings["ENABLE_MOUSE_LOCKER"]
-ENABLE_SLEEP_BLOCKER = settings["ENABLE_SLEEP_BLOCKER"]
-ENABLE_SECURITY_MONITOR = settings["ENABLE_SECURITY_MONITOR"]
-CLOSE_BUTTON_DISABLED = settings["CLOSE_BUTTON_DISABLED"]
-ENABLE_LOGGER = settings["ENABLE_LOGGER"]
+# When set, the game writes the wall-clock time its first task appeared to
+# this file and exits. Export uses it to time launch-to-first-task.
+STARTUP_PROBE_ENV = "NACHOCORE_STARTUP_PROBE"
+# When set to 1, GameUI samples memory after every task transition with
+# shared.utils.memory_probe and logs a growth summary at the end of the deck.
+MEMORY_PROBE_ENV = "NACHOCORE_MEMORY_PROBE"
 
-from shared.utils.close_button_blocker import disable_close_button, enable_close_button
-from shared.utils.keyboard_blocker import start_keyboard_blocker, stop_keyboard_blocker
-from shared.utils.mouse_locker import start_mouse_locker, stop_mouse_locker
-from shared.utils.sleep_blocker import start_sleep_blocker, stop_sleep_blocker
-from shared.utils.security_monitor import start_security_monitor, stop_security_monitor
-from shared.utils.logger import log_event
+# Lockdown helpers (pynput, psutil, Win32 calls), the close-button blocker and
+# the memory probe are imported only when their feature is enabled, and each
+# task module only when the deck first reaches its type. game/import_report.py
+# checks this import budget.
 from shared.utils.ui_keyboard import UIKeyboardWidget
-from shared.theme.theme import load_stylesheet
-
-# Use get_data_path() to locate tasks.json.
-TASKS_FILE = get_data_path(os.path.join("builder", "tasks", "tasks.json"))
-
-def normalize_task_type(task_type: str) -> str:
-    return task_type.lower().replace(" ", "_")
-
-def load_all_tasks():
-    if not os.path.exists(TASKS_FILE):
-        return []
-    try:
-        with open(TASKS_FILE, "r") as f:
-            data = json.load(f)
-        if isinstance(data, list):
-            for task in data:
-                if "type" in task:
-                    task["TASK_TYPE"] = normalize_task_type(task.pop("type"))
-                elif "TASK_TYPE" in task:
-                    task["TASK_TYPE"] = normalize_task_type(task["TASK_TYPE"])
-            return data
-        return []
-    except Exception as e:
-        print("Error loading tasks:", e)
-        return []
-
-def discover_task_modules():
-    """
-    Discover task modules by scanning the shared/tasks folder.
-    If running frozen, return a static manifest.
-    """
-    if getattr(sys, "frozen", False):
-        return {
-            "location_collection": "shared.tasks.location_collection",
-            "multiple_choice": "shared.tasks.multiple_choice",
-            "name_collection": "shared.tasks.name_collection",
-            "short_answer": "shared.tasks.short_answer"
-        }
-    task_modules = {}
-    tasks_folder = get_data_path(os.path.join("shared", "tasks"))
-    for filepath in glob.glob(os.path.join(tasks_folder, "*.py")):
-        filename = os.path.basename(filepath)
-        if filename == "__init__.py":
-            continue
-        module_name = os.path.splitext(filename)[0]
-        spec = importlib.util.spec_from_file_location(module_name, filepath)
-        module = importlib.util.module_from_spec(spec)
-        try:
-            spec.loader.exec_module(module)
-            if hasattr(module, "TASK_TYPE"):
-                normalized = normalize_task_type(module.TASK_TYPE)
-                task_modules[normalized] = f"shared.tasks.{module_name}"
-        except Exception as e:
-            print(f"Error importing {filename}: {e}")
-    return task_modules
 
 currentLineEdit = None
 
@@ -142,59 +46,61 @@ class UIKeyboardEventFilter(QObject):
             currentLineEdit = self.line_edit
         return False
 
-def install_ui_keyboard(widget, keyboard_widget):
+def install_ui_keyboard(widget, keyboard_widget, read_only=True):
     for le in widget.findChildren(QLineEdit):
         le.installEventFilter(UIKeyboardEventFilter(le, keyboard_widget))
-        le.setReadOnly(USE_UI_KEYBOARD)
+        le.setReadOnly(read_only)
         le.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
     le_list = widget.findChildren(QLineEdit)
     if le_list:
         le_list[0].setFocus()
 
 class GameUI(QMainWindow):
-    def __init__(self):
+    def __init__(self, config=None, start_index=0):
+        """
+        config: the RuntimeConfig to play; defaults to the one resolved at boot.
+        The builder's preview passes its own, with every lockdown feature
+        switched off.
+        """
         super().__init__()
-        if CLOSE_BUTTON_DISABLED:
+        self.config = config if config is not None else get_runtime_config()
+        self.settings = self.config.settings
+        if self.settings["CLOSE_BUTTON_DISABLED"]:
+            from shared.utils.close_button_blocker import disable_close_button
             disable_close_button(self)
         self.setGeometry(100, 100, 800, 600)
-        if ENABLE_LOGGER:
-            log_event("Game starting up...")
-        self.tasks = load_all_tasks()
-        if ENABLE_LOGGER:
-            log_event(f"Loaded tasks: {self.tasks}")
-        self.current_task_index = 0
-        self.discovered_tasks = discover_task_modules()
-        self.gift_card = self.load_gift_card_from_config()
+        logger.info("Game starting up...")
+        self.tasks = self.config.tasks
+        logger.info("Loaded %d tasks", len(self.tasks))
+        logger.debug("Loaded tasks: %s", self.tasks)
+        self.current_task_index = max(0, min(start_index, len(self.tasks)))
+        self.current_task = None
+        self.discovered_tasks = self.config.task_modules
+        self.gift_card = self.config.gift_card
         self.keyboard_blocker = None
-        if KEYBOARD_BLOCKER_MODE in (1, 2):
-            self.keyboard_blocker = start_keyboard_blocker(mode=KEYBOARD_BLOCKER_MODE)
-            if ENABLE_LOGGER:
-                log_event(f"Keyboard blocker started (mode={KEYBOARD_BLOCKER_MODE}).")
+        keyboard_blocker_mode = self.settings["KEYBOARD_BLOCKER_MODE"]
+        if keyboard_blocker_mode in (1, 2):
+            from shared.utils.keyboard_blocker import start_keyboard_blocker
+            self.keyboard_blocker = start_keyboard_blocker(mode=keyboard_blocker_mode)
+            logger.info("Keyboard blocker started (mode=%s).", keyboard_blocker_mode)
         self.mouse_locker_timer = None
-        if ENABLE_MOUSE_LOCKER:
+        if self.settings["ENABLE_MOUSE_LOCKER"]:
+            from shared.utils.mouse_locker import start_mouse_locker
             self.mouse_locker_timer = start_mouse_locker(self)
-            if ENABLE_LOGGER:
-                log_event("Mouse locker started.")
-        if ENABLE_SLEEP_BLOCKER:
+            logger.info("Mouse locker started.")
+        if self.settings["ENABLE_SLEEP_BLOCKER"]:
+            from shared.utils.sleep_blocker import start_sleep_blocker
             start_sleep_blocker()
-            if ENABLE_LOGGER:
-                log_event("Sleep blocker started.")
-        if ENABLE_SECURITY_MONITOR:
+            logger.info("Sleep blocker started.")
+        if self.settings["ENABLE_SECURITY_MONITOR"]:
+            from shared.utils.security_monitor import start_security_monitor
             start_security_monitor()
-            if ENABLE_LOGGER:
-                log_event("Security monitor started.")
+            logger.info("Security monitor started.")
         self.central_widget = QWidget()
         self.setCentralWidget(self.central_widget)
         self.layout = QVBoxLayout(self.central_widget)
-        stylesheet_path = get_data_path(os.path.join("shared", "theme", "styles.qss"))
-        if os.path.exists(stylesheet_path):
-            try:
-                with open(stylesheet_path, "r") as f:
-                    stylesheet = f.read()
-                    self.setStyleSheet(stylesheet)
-            except Exception as e:
-                if ENABLE_LOGGER:
-                    log_event(f"Error loading stylesheet: {e}")
+        if self.config.stylesheet:
+            self.setStyleSheet(self.config.stylesheet)
         self.progress_label = QLabel("Gift Card Progress: 0%")
         self.progress_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.layout.addWidget(self.progress_label)
@@ -205,35 +111,13 @@ class GameUI(QMainWindow):
         self.ui_keyboard.hide()
         self.ui_keyboard.keyPressed.connect(self.on_keyboard_key_pressed)
         self.layout.addWidget(self.ui_keyboard)
+        self.memory_probe = None
+        if os.environ.get(MEMORY_PROBE_ENV, "") not in ("", "0"):
+            from shared.utils.memory_probe import MemoryProbe
+            self.memory_probe = MemoryProbe(self)
         self.load_next_task()
         self.center_window()
 
-    def load_gift_card_from_config(self):
-        import sys
-        if getattr(sys, "frozen", False):
-            try:
-                from builder.static_manifest import GIFT_CARD_STATIC
-                print("DEBUG: Loaded gift card from static manifest:", GIFT_CARD_STATIC)
-                return GIFT_CARD_STATIC
-            except Exception as e:
-                print("Error loading static gift card from manifest:", e)
-        config_file = get_data_path(os.path.join("builder", "config.json"))
-        try:
-            with open(config_file, "r") as f:
-                config_data = json.load(f)
-                gift = config_data.get("selected_gift_card", {})
-                result = {
-                    "code": gift.get("code", "XXXX-XXXX-XXXX"),
-                    "pin": gift.get("pin", "----"),
-                    "name": gift.get("name", "Gift Card"),
-                    "pin_required": gift.get("pin_required", True)
-                }
-                print("DEBUG: Loaded gift card from config.json:", result)
-                return result
-        except Exception as e:
-            print("Error loading gift card config:", e)
-            return {"code": "XXXX-XXXX-XXXX", "pin": "----", "name": "Gift Card", "pin_required": True}
-
     def center_window(self):
         screen_geometry = QApplication.primaryScreen().availableGeometry()
         window_geometry = self.frameGeometry()
@@ -242,10 +126,35 @@ class GameUI(QMainWindow):
         self.move(window_geometry.topLeft())
 
     def load_next_task(self):
+        with logger.span("task_load", index=self.current_task_index):
+            self._load_next_task()
+
+    def dispose_current_task(self):
+        """
+        Releases the finished task: its widgets are scheduled for deletion
+        (deleteLater, since this usually runs inside the task's own Submit
+        handler) and the Task instance and keyboard target are dropped.
+
+        A Task may define dispose(), called here once it is finished, to drop
+        its references to the game-mode widgets it created in get_widget().
+        """
+        global currentLineEdit
         for i in reversed(range(self.task_layout.count())):
             widget = self.task_layout.itemAt(i).widget()
             if widget:
-                widget.setParent(None)
+                self.task_layout.removeWidget(widget)
+                widget.hide()
+                widget.deleteLater()
+        if self.current_task is not None and hasattr(self.current_task, "dispose"):
+            try:
+                self.current_task.dispose()
+            except Exception as e:
+                logger.error("Error disposing task: %s", e)
+        self.current_task = None
+        currentLineEdit = None
+
+    def _load_next_task(self):
+        self.dispose_current_task()
         if self.current_task_index < len(self.tasks):
             task_data = self.tasks[self.current_task_index]
             task_type = task_data.get("TASK_TYPE", "short_answer")
@@ -258,24 +167,22 @@ class GameUI(QMainWindow):
                         try:
                             task_instance.set_task_data(task_data)
                         except Exception as ex:
-                            if ENABLE_LOGGER:
-                                log_event(f"Error applying saved data for {task_type}: {ex}")
+                            logger.error("Error applying saved data for %s: %s", task_type, ex)
                     task_widget = task_instance.get_widget(self.task_finished)
+                    self.current_task = task_instance
                     self.task_layout.addWidget(task_widget)
-                    install_ui_keyboard(task_widget, self.ui_keyboard)
+                    install_ui_keyboard(task_widget, self.ui_keyboard, self.settings["USE_UI_KEYBOARD"])
                     if task_widget.findChildren(QLineEdit):
                         self.ui_keyboard.show()
                     else:
                         self.ui_keyboard.hide()
                     self.update_gift_card_reveal()
                 except Exception as e:
-                    if ENABLE_LOGGER:
-                        log_event(f"Error loading task: {e}")
+                    logger.error("Error loading task: %s", e)
                     error_label = QLabel(f"Error loading task: {e}")
                     self.task_layout.addWidget(error_label)
             else:
-                if ENABLE_LOGGER:
-                    log_event(f"Task type '{task_type}' not discovered.")
+                logger.warning("Task type '%s' not discovered.", task_type)
                 error_label = QLabel(f"Task type '{task_type}' not found.")
                 self.task_layout.addWidget(error_label)
         else:
@@ -292,12 +199,14 @@ class GameUI(QMainWindow):
 
     def task_finished(self, success):
         if success:
-            self.current_task_index += 1
-            self.update_progress()
-            self.load_next_task()
+            with logger.span("transition", index=self.current_task_index):
+                self.current_task_index += 1
+                self.update_progress()
+                self.load_next_task()
+            if self.memory_probe is not None:
+                self.memory_probe.sample(self.current_task_index)
         else:
-            if ENABLE_LOGGER:
-                log_event("Task finished with incorrect answer.")
+            logger.info("Task finished with incorrect answer.")
 
     def update_progress(self):
         if self.tasks:
@@ -318,10 +227,7 @@ class GameUI(QMainWindow):
 
     def complete_game(self):
         # Remove all task widgets.
-        for i in reversed(range(self.task_layout.count())):
-            widget = self.task_layout.itemAt(i).widget()
-            if widget:
-                widget.setParent(None)
+        self.dispose_current_task()
         self.ui_keyboard.hide()
         
         # Remove and delete the progress label.
@@ -329,12 +235,11 @@ class GameUI(QMainWindow):
         self.progress_label.deleteLater()
         
         # Re-enable the close button if it was disabled.
-        if CLOSE_BUTTON_DISABLED:
+        if self.settings["CLOSE_BUTTON_DISABLED"]:
             from shared.utils.close_button_blocker import enable_close_button
             enable_close_button(self)
         
-        # Debug: Print out the gift card data.
-        print("DEBUG: Gift card data at final screen:", self.gift_card)
+        logger.debug("Gift card data at final screen: %s", self.gift_card)
         
         # Safely extract gift card details.
         try:
@@ -346,7 +251,7 @@ class GameUI(QMainWindow):
             if pin_required:
                 final_text += f"\nPIN: {pin}"
         except Exception as e:
-            print("DEBUG: Error constructing final gift card text:", e)
+            logger.error("Error constructing final gift card text: %s", e)
             final_text = "Error reading gift card data."
         
         # Create the final screen UI.
@@ -359,22 +264,23 @@ class GameUI(QMainWindow):
         self.layout.addWidget(exit_btn)
         
         self.unlock_system()
-        if ENABLE_LOGGER:
-            log_event("Game completed successfully.")
+        logger.info("Game completed successfully.")
+        if self.memory_probe is not None:
+            logger.info(self.memory_probe.summary())
 
 
     def unlock_system(self):
-        from shared.utils.keyboard_blocker import stop_keyboard_blocker
-        from shared.utils.mouse_locker import stop_mouse_locker
-        from shared.utils.sleep_blocker import stop_sleep_blocker
-        from shared.utils.security_monitor import stop_security_monitor
         if self.keyboard_blocker:
+            from shared.utils.keyboard_blocker import stop_keyboard_blocker
             stop_keyboard_blocker(self.keyboard_blocker)
         if self.mouse_locker_timer:
+            from shared.utils.mouse_locker import stop_mouse_locker
             stop_mouse_locker()
-        if ENABLE_SLEEP_BLOCKER:
+        if self.settings["ENABLE_SLEEP_BLOCKER"]:
+            from shared.utils.sleep_blocker import stop_sleep_blocker
             stop_sleep_blocker()
-        if ENABLE_SECURITY_MONITOR:
+        if self.settings["ENABLE_SECURITY_MONITOR"]:
+            from shared.utils.security_monitor import stop_security_monitor
             stop_security_monitor()
 
     def closeEvent(self, event):
@@ -383,8 +289,20 @@ class GameUI(QMainWindow):
 
 def main():
     app = QApplication(sys.argv)
-    window = GameUI()
-    window.show()
+    probe_path = os.environ.get(STARTUP_PROBE_ENV)
+    config = get_runtime_config()
+    logger.configure(enabled=config.settings["ENABLE_LOGGER"])
+    if probe_path:
+        window = GameUI(config.with_overrides(settings=UNLOCKED_SETTINGS))
+        window.show()
+        app.processEvents()
+        import time
+        with open(probe_path, "w") as f:
+            f.write(repr(time.time()))
+        QTimer.singleShot(0, app.quit)
+    else:
+        window = GameUI(config)
+        window.show()
     sys.exit(app.exec())
 
 if __name__ == "__main__":
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# game/import_report.py
+"""
+Import-time report for game startup.
+
+Boots the game offscreen to its first task in a fresh interpreter under
+-X importtime and checks the result against the game's import budget:
+
+- modules in DEFERRED_MODULES (network and lockdown dependencies, debug
+  tooling) must not be imported before the first task is shown;
+- of the task modules, only the first task's type may be imported;
+- everything imported on the way must fit in the time budget.
+
+It then lists the remaining critical-path imports, slowest first. Task
+modules are imported with importlib, which -X importtime does not time, so
+they are checked but do not appear in the tables.
+
+    python -m game.import_report [--budget-ms N] [--limit N]
+"""
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.abspath(os.path.join(current_dir, ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from shared.utils.import_timing import run_importtime, slowest
+
+IMPORT_BUDGET_MS = 250
+
+# Top-level packages/modules that belong after the first task, if anywhere.
+DEFERRED_MODULES = (
+    "requests", "urllib3", "certifi", "charset_normalizer", "idna",
+    "pynput", "psutil", "win32api", "win32con", "win32gui", "pywintypes",
+    "shared.utils.keyboard_blocker", "shared.utils.mouse_locker",
+    "shared.utils.sleep_blocker", "shared.utils.security_monitor",
+    "shared.utils.close_button_blocker", "shared.utils.memory_probe",
+    "tracemalloc", "cProfile", "pstats",
+)
+
+BOOT_STATEMENT = (
+    "import game.game as g; "
+    "from game.runtime_config import get_runtime_config, UNLOCKED_SETTINGS; "
+    "app = g.QApplication([]); "
+    "window = g.GameUI(get_runtime_config().with_overrides(settings=UNLOCKED_SETTINGS))"
+)
+
+
+def _is_deferred(name):
+    return any(name == m or name.startswith(m + ".") for m in DEFERRED_MODULES)
+
+
+def first_task_module():
+    from game.runtime_config import load_runtime_config, UNLOCKED_SETTINGS
+    config = load_runtime_config(settings=UNLOCKED_SETTINGS, gift_card={})
+    if not config.tasks:
+        return None
+    return config.task_modules.get(config.tasks[0].get("TASK_TYPE", "short_answer"))
+
+
+def build_report(records, loaded, budget_ms, limit):
+    """Returns (report text, list of budget violations)."""
+    total_ms = sum(r.cumulative_us for r in records if r.depth == 0) / 1000
+    violations = []
+    deferred = sorted(name for name in loaded if _is_deferred(name))
+    if deferred:
+        violations.append("imported before the first task: " + ", ".join(deferred))
+    expected = first_task_module()
+    tasks = sorted(name for name in loaded if name.startswith("shared.tasks."))
+    unexpected = [name for name in tasks if name != expected]
+    if unexpected:
+        violations.append("task modules not needed for the first task: " + ", ".join(unexpected))
+    if total_ms > budget_ms:
+        violations.append(f"startup imports took {total_ms:.1f} ms (budget {budget_ms:.0f} ms)")
+
+    lines = [f"Startup imports: {len(records)} modules timed, {total_ms:.1f} ms (budget {budget_ms:.0f} ms)",
+             f"Task modules imported: {', '.join(tasks) or 'none'} (first task: {expected or 'none'})",
+             "",
+             "Critical path (first two import levels, slowest first):",
+             f"  {'cumulative':>10}  {'self':>8}  module"]
+    critical = [r for r in records if r.depth <= 1]
+    for r in slowest(critical, limit=limit):
+        lines.append(f"  {r.cumulative_us / 1000:8.1f}ms  {r.self_us / 1000:6.1f}ms  {'  ' * r.depth}{r.name}")
+    lines += ["", "Slowest modules by own time:"]
+    for r in slowest(records, limit=limit, key="self_us"):
+        lines.append(f"  {r.self_us / 1000:8.1f}ms  {r.name}")
+    lines.append("")
+    if violations:
+        lines += ["OVER BUDGET:"] + [f"  - {v}" for v in violations]
+    else:
+        lines.append("Within the import budget.")
+    return "\n".join(lines), violations
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Report and check the imports on the game's path to its first task.")
+    parser.add_argument("--budget-ms", type=float, default=IMPORT_BUDGET_MS,
+                        help=f"Time budget for startup imports (default: {IMPORT_BUDGET_MS} ms)")
+    parser.add_argument("--limit", type=int, default=20, help="Rows per table (default: 20)")
+    args = parser.parse_args()
+    records, loaded = run_importtime(BOOT_STATEMENT, PROJECT_ROOT)
+    report, violations = build_report(records, loaded, args.budget_ms, args.limit)
+    print(report)
+    sys.exit(1 if violations else 0)
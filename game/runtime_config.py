@@ -0,0 +1,171 @@
+# game/runtime_config.py
+"""
+Runtime configuration for the game, resolved once at boot.
+
+load_runtime_config() reads every runtime input in a single pass: security
+settings and gift card (from the static manifest when frozen, otherwise from
+one read of config.json), the task-type manifest, the deck and the
+stylesheet. The result is an immutable RuntimeConfig that GameUI and every
+other game component read from; nothing re-reads a file after boot.
+
+Callers that already hold some of the inputs (the builder's preview, the
+startup probe, the soak test) pass them as overrides and those inputs are
+not loaded at all.
+"""
+import os
+import sys
+from collections import namedtuple
+from types import MappingProxyType
+
+from shared.utils.data_helpers import get_data_path, load_json_resource
+from shared.utils import logger
+from shared.utils.task_discovery import scan_task_modules, normalize_task_type
+from shared.theme.theme import load_stylesheet
+
+CONFIG_RESOURCE = "builder/config.json"
+TASKS_RESOURCE = "builder/tasks/tasks.json"
+STYLESHEET_RESOURCE = "shared/theme/styles.qss"
+
+DEFAULT_SETTINGS = {
+    "USE_UI_KEYBOARD": True,
+    "KEYBOARD_BLOCKER_MODE": 1,
+    "ENABLE_MOUSE_LOCKER": False,
+    "ENABLE_SLEEP_BLOCKER": False,
+    "ENABLE_SECURITY_MONITOR": False,
+    "CLOSE_BUTTON_DISABLED": False,
+    "ENABLE_LOGGER": True
+}
+
+# Settings with every system-level lockdown feature off. Used by the builder's
+# preview and by startup-probe runs.
+UNLOCKED_SETTINGS = {
+    "USE_UI_KEYBOARD": False,
+    "KEYBOARD_BLOCKER_MODE": 0,
+    "ENABLE_MOUSE_LOCKER": False,
+    "ENABLE_SLEEP_BLOCKER": False,
+    "ENABLE_SECURITY_MONITOR": False,
+    "CLOSE_BUTTON_DISABLED": False,
+    "ENABLE_LOGGER": True
+}
+
+DEFAULT_GIFT_CARD = {"code": "XXXX-XXXX-XXXX", "pin": "----", "name": "Gift Card", "pin_required": True}
+
+# Used by a frozen build whose static manifest cannot be imported.
+BUILTIN_TASK_MODULES = {
+    "location_collection": "shared.tasks.location_collection",
+    "multiple_choice": "shared.tasks.multiple_choice",
+    "name_collection": "shared.tasks.name_collection",
+    "short_answer": "shared.tasks.short_answer"
+}
+
+
+# A slotted namedtuple rather than a frozen dataclass: importing dataclasses
+# (and through it inspect) was the largest avoidable cost on the startup path.
+class RuntimeConfig(namedtuple("RuntimeConfig", ["settings", "gift_card", "task_modules", "tasks", "stylesheet"])):
+    __slots__ = ()
+
+    def with_overrides(self, **changes):
+        """Returns a copy with some inputs replaced (plain dicts/lists are frozen)."""
+        return self._replace(**_freeze_inputs(changes))
+
+
+def _freeze_inputs(inputs):
+    frozen = {}
+    for name, value in inputs.items():
+        if name in ("settings", "gift_card", "task_modules"):
+            value = MappingProxyType(dict(value))
+        elif name == "tasks":
+            value = tuple(MappingProxyType(dict(task)) for task in value)
+        frozen[name] = value
+    return frozen
+
+
+def _normalize_deck(data):
+    if not isinstance(data, list):
+        return []
+    for task in data:
+        if "type" in task:
+            task["TASK_TYPE"] = normalize_task_type(task.pop("type"))
+        elif "TASK_TYPE" in task:
+            task["TASK_TYPE"] = normalize_task_type(task["TASK_TYPE"])
+    return data
+
+
+def _read_json(resource, default):
+    try:
+        return load_json_resource(resource)
+    except FileNotFoundError:
+        return default
+    except Exception as e:
+        logger.error("Error reading %s: %s", resource, e)
+        return default
+
+
+def _load_static_manifest():
+    try:
+        from builder import static_manifest
+        return static_manifest
+    except Exception as e:
+        logger.warning("Error loading static manifest: %s", e)
+        return None
+
+
+def _gift_card_from(config):
+    gift = config.get("selected_gift_card", {})
+    return {
+        "code": gift.get("code", DEFAULT_GIFT_CARD["code"]),
+        "pin": gift.get("pin", DEFAULT_GIFT_CARD["pin"]),
+        "name": gift.get("name", DEFAULT_GIFT_CARD["name"]),
+        "pin_required": gift.get("pin_required", DEFAULT_GIFT_CARD["pin_required"])
+    }
+
+
+def discover_task_modules():
+    """Maps each normalized TASK_TYPE in shared/tasks to its module, without importing any."""
+    return scan_task_modules(get_data_path(os.path.join("shared", "tasks")))
+
+
+def load_runtime_config(tasks=None, settings=None, gift_card=None):
+    """Resolves all runtime inputs not passed in and returns a RuntimeConfig."""
+    with logger.span("runtime_config"):
+        manifest = _load_static_manifest() if getattr(sys, "frozen", False) else None
+        config = None
+        if (settings is None or gift_card is None) and manifest is None:
+            config = _read_json(CONFIG_RESOURCE, {})
+
+        if settings is None:
+            settings = dict(DEFAULT_SETTINGS)
+            settings.update(manifest.SECURITY_SETTINGS_STATIC if manifest is not None else config)
+        if gift_card is None:
+            gift_card = manifest.GIFT_CARD_STATIC if manifest is not None else _gift_card_from(config)
+        if manifest is not None:
+            task_modules = manifest.TASK_MANIFEST
+        elif getattr(sys, "frozen", False):
+            task_modules = BUILTIN_TASK_MODULES
+        else:
+            task_modules = discover_task_modules()
+        if tasks is None:
+            tasks = _normalize_deck(_read_json(TASKS_RESOURCE, []))
+        stylesheet = load_stylesheet(STYLESHEET_RESOURCE)
+
+        runtime_config = RuntimeConfig(**_freeze_inputs({
+            "settings": settings,
+            "gift_card": gift_card,
+            "task_modules": task_modules,
+            "tasks": tasks,
+            "stylesheet": stylesheet,
+        }))
+    logger.debug("Runtime config: %d task(s), %d task type(s)",
+                 len(runtime_config.tasks), len(runtime_config.task_modules))
+    return runtime_config
+
+
+_boot_config = None
+
+
+def get_runtime_config():
+    """Returns the game's RuntimeConfig, loading it on first use."""
+    global _boot_config
+    if _boot_config is None:
+        _boot_config = load_runtime_config()
+    return _boot_config
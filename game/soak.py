@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# game/soak.py
+"""
+Soak test for task lifecycle memory.
+
+Plays a synthetic deck (1,000 tasks by default, cycling through every built-in
+task type) in an offscreen GameUI by answering and submitting each task, and
+samples live widgets, QObjects and tracemalloc usage after every transition.
+Exits non-zero if any of them keeps growing once the warm-up is over.
+
+    python -m game.soak [--tasks N] [--max-widget-growth N] [--max-traced-kb N]
+"""
+import os
+import sys
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.abspath(os.path.join(current_dir, ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from PyQt6.QtWidgets import QApplication, QLineEdit, QPushButton, QRadioButton
+from PyQt6.QtCore import QCoreApplication, QEvent
+
+from shared.utils import logger
+from shared.utils.memory_probe import MemoryProbe
+
+SOAK_GIFT_CARD = {"code": "SOAK-SOAK-SOAK", "pin": "0000", "name": "Soak", "pin_required": False}
+
+
+def build_deck(count):
+    """Every task can be answered without user input or network access."""
+    templates = [
+        {"TASK_TYPE": "multiple_choice", "question": "Pick the first option.",
+         "options": ["First", "Second", "Third"], "correct_indices": [0]},
+        {"TASK_TYPE": "short_answer", "question": "Type anything.",
+         "acceptable_answers": [], "has_correct": False},
+        {"TASK_TYPE": "name_collection", "question": "Name?", "answer": "Soak"},
+        {"TASK_TYPE": "location_collection", "question": "Where?", "answer": "Nowhere"},
+    ]
+    return [dict(templates[i % len(templates)], question=f"Task {i + 1}") for i in range(count)]
+
+
+def answer_current_task(window):
+    """Fills in the visible task and presses its Submit button."""
+    item = window.task_layout.itemAt(0)
+    container = item.widget() if item is not None else None
+    if container is None:
+        return False
+    radios = container.findChildren(QRadioButton)
+    if radios:
+        radios[0].setChecked(True)
+    for line_edit in container.findChildren(QLineEdit):
+        if not line_edit.text():
+            line_edit.setText("soak")
+    for button in container.findChildren(QPushButton):
+        if button.text() == "Submit":
+            button.click()
+            return True
+    return False
+
+
+def flush_deferred_deletes():
+    # What the event loop would do between two clicks.
+    QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+    QCoreApplication.processEvents()
+
+
+def run_soak(task_count, max_widget_growth, max_traced_kb):
+    app = QApplication.instance() or QApplication(sys.argv)
+    logger.configure(echo_level=logger.WARNING)
+    from game.game import GameUI
+    from game.runtime_config import load_runtime_config, UNLOCKED_SETTINGS
+    config = load_runtime_config(tasks=build_deck(task_count), settings=UNLOCKED_SETTINGS, gift_card=SOAK_GIFT_CARD)
+    window = GameUI(config)
+    window.show()
+    probe = MemoryProbe(window)
+    flush_deferred_deletes()
+    probe.sample(0)
+    for _ in range(task_count):
+        if not answer_current_task(window):
+            print(f"Task {window.current_task_index + 1} could not be answered.")
+            return 2
+        flush_deferred_deletes()
+        probe.sample(window.current_task_index)
+    if window.current_task_index != task_count:
+        print(f"Deck stopped at task {window.current_task_index} of {task_count}.")
+        return 2
+
+    print(probe.summary())
+    growth = probe.growth()
+    widget_delta = growth["widgets"][0]
+    qobject_delta = growth["qobjects"][0]
+    traced_kb = growth["traced_bytes"][0] / 1024
+    probe.stop()
+    window.close()
+    failures = []
+    if widget_delta > max_widget_growth:
+        failures.append(f"live widgets grew by {widget_delta:.1f}")
+    if qobject_delta > max_widget_growth:
+        failures.append(f"window QObjects grew by {qobject_delta:.1f}")
+    if traced_kb > max_traced_kb:
+        failures.append(f"traced memory grew by {traced_kb:.1f} KB")
+    if failures:
+        print("LEAK: " + "; ".join(failures))
+        return 1
+    print("Memory stayed flat.")
+    return 0
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Play a long synthetic deck offscreen and check for memory growth.")
+    parser.add_argument("--tasks", type=int, default=1000, help="Number of tasks to play (default: 1000)")
+    parser.add_argument("--max-widget-growth", type=float, default=0.5,
+                        help="Allowed growth in live widgets/QObjects after warm-up (default: 0.5)")
+    parser.add_argument("--max-traced-kb", type=float, default=64.0,
+                        help="Allowed growth in tracemalloc total after warm-up, in KB (default: 64)")
+    args = parser.parse_args()
+    sys.exit(run_soak(args.tasks, args.max_widget_growth, args.max_traced_kb))
@@ -1,37 +1,28 @@
 import os
 import json
-import glob
 import pprint
-from builder.utils import normalize_task_type
+from shared.utils import logger
+from shared.utils.data_helpers import EMBEDDED_RESOURCES
+# Re-exported: export imports scan_task_modules from here.
+from shared.utils.task_discovery import scan_task_modules
 
 def get_project_root():
     return os.path.abspath(os.path.join(os.path.dirname(__file__), "."))
 
 def generate_static_manifest():
+    with logger.span("manifest_generation", level=logger.INFO):
+        _generate_static_manifest()
+
+def _generate_static_manifest():
     project_root = get_project_root()
-    tasks_folder = os.path.join(project_root, "shared", "tasks")
-    task_manifest = {}
-    for filepath in glob.glob(os.path.join(tasks_folder, "*.py")):
-        filename = os.path.basename(filepath)
-        if filename == "__init__.py":
-            continue
-        module_name = os.path.splitext(filename)[0]
-        try:
-            spec = __import__("importlib").util.spec_from_file_location(module_name, filepath)
-            module = __import__("importlib").util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-            if hasattr(module, "TASK_TYPE"):
-                normalized = normalize_task_type(module.TASK_TYPE)
-                task_manifest[normalized] = f"shared.tasks.{module_name}"
-        except Exception as e:
-            print("Error processing {}: {}".format(filename, e))
+    task_manifest = scan_task_modules(os.path.join(project_root, "shared", "tasks"))
     
     config_path = os.path.join(project_root, "builder", "config.json")
     try:
         with open(config_path, "r") as f:
             config = json.load(f)
     except Exception as e:
-        print("Error loading config.json:", e)
+        logger.error("Error loading config.json: %s", e)
         config = {}
     
     gift_card_static = config.get("selected_gift_card", {})
@@ -54,9 +45,35 @@ def generate_static_manifest():
             f.write("TASK_MANIFEST = " + pprint.pformat(manifest["TASK_MANIFEST"]) + "\n\n")
             f.write("GIFT_CARD_STATIC = " + pprint.pformat(manifest["GIFT_CARD_STATIC"]) + "\n\n")
             f.write("SECURITY_SETTINGS_STATIC = " + pprint.pformat(manifest["SECURITY_SETTINGS_STATIC"]) + "\n")
-        print("Static manifest generated at:", manifest_path)
+        logger.info("Static manifest generated at: %s", manifest_path)
+    except Exception as e:
+        logger.error("Error writing static manifest: %s", e)
+
+def generate_static_resources():
+    """
+    Compiles the runtime data files (stylesheet, config, deck) into
+    builder/static_resources.py so a frozen game loads them in one import.
+    """
+    project_root = get_project_root()
+    resources = {}
+    for rel_path in EMBEDDED_RESOURCES:
+        path = os.path.join(project_root, *rel_path.split("/"))
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                resources[rel_path] = f.read()
+        except FileNotFoundError:
+            continue
+        except Exception as e:
+            logger.error("Error reading %s: %s", rel_path, e)
+    resources_path = os.path.join(project_root, "builder", "static_resources.py")
+    try:
+        with open(resources_path, "w", encoding="utf-8") as f:
+            f.write("# This file is auto-generated. Do not edit manually.\n")
+            f.write("RESOURCES = " + pprint.pformat(resources) + "\n")
+        logger.info("Static resources generated at: %s", resources_path)
     except Exception as e:
-        print("Error writing static manifest:", e)
+        logger.error("Error writing static resources: %s", e)
 
 if __name__ == "__main__":
     generate_static_manifest()
+    generate_static_resources()
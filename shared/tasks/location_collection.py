@@ -1,6 +1,9 @@
 TASK_TYPE = "location_collection"
+TASK_SCHEMA = {
+    "question": {"type": str, "required": True},
+    "answer": {"type": str},
+}
 
-import requests
 import random
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QLineEdit, QPushButton, QFormLayout
 from PyQt6.QtCore import Qt
@@ -17,6 +20,12 @@ class Task:
         ]
     
     def auto_detect_location(self):
+        # requests is imported only when a location actually has to be looked up,
+        # so decks that never reach this task (and the builder) don't load it.
+        try:
+            import requests
+        except ImportError:
+            return ""
         try:
             response = requests.get("https://ipapi.co/json/", timeout=5)
             if response.status_code == 200:
@@ -101,3 +110,7 @@ class Task:
             self.question_edit.clear()
         if hasattr(self, "answer_edit"):
             self.answer_edit.clear()
+
+    def dispose(self):
+        self.location_input = None
+        self.feedback_label = None
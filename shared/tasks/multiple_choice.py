@@ -1,4 +1,9 @@
 TASK_TYPE = "multiple_choice"
+TASK_SCHEMA = {
+    "question": {"type": str, "required": True},
+    "options": {"type": list, "items": str, "min_items": 2, "required": True},
+    "correct_indices": {"type": list, "items": int, "min_items": 1, "index_of": "options", "required": True},
+}
 
 import random
 from PyQt6.QtWidgets import (
@@ -166,3 +171,7 @@ class Task:
         for row in self.option_rows:
             row["option_edit"].clear()
             row["correct_checkbox"].setChecked(False)
+
+    def dispose(self):
+        self.button_group = None
+        self.feedback_label = None
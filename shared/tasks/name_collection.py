@@ -1,4 +1,8 @@
 TASK_TYPE = "name_collection"
+TASK_SCHEMA = {
+    "question": {"type": str, "required": True},
+    "answer": {"type": str},
+}
 import getpass
 import random
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QLineEdit, QPushButton, QFormLayout
@@ -80,3 +84,7 @@ class Task:
             self.question_edit.clear()
         if hasattr(self, "answer_edit"):
             self.answer_edit.clear()
+
+    def dispose(self):
+        self.name_input = None
+        self.feedback_label = None
@@ -1,4 +1,9 @@
 TASK_TYPE = "short_answer"
+TASK_SCHEMA = {
+    "question": {"type": str, "required": True},
+    "acceptable_answers": {"type": list, "items": str, "non_empty_when": "has_correct"},
+    "has_correct": {"type": bool},
+}
 
 import random
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QLineEdit, QCheckBox, QPushButton, QFormLayout
@@ -107,3 +112,7 @@ class Task:
             self.question_edit.clear()
         if hasattr(self, "answers_edit"):
             self.answers_edit.clear()
+
+    def dispose(self):
+        self.answer_input = None
+        self.feedback_label = None
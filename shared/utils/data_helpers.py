@@ -1,4 +1,15 @@
-import sys, os
+import sys, os, json
+
+# Files that export compiles into builder/static_resources.py. A frozen game
+# loads them all with a single module import instead of opening each file.
+EMBEDDED_RESOURCES = (
+    "shared/theme/styles.qss",
+    "builder/config.json",
+    "builder/tasks/tasks.json",
+)
+
+_embedded = None
+
 
 def get_data_path(relative_path):
     """
@@ -11,3 +22,36 @@ def get_data_path(relative_path):
     else:
         base_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
     return os.path.join(base_path, relative_path)
+
+
+def _embedded_resources():
+    """Returns the embedded resource bundle when frozen, else an empty dict."""
+    global _embedded
+    if _embedded is None:
+        _embedded = {}
+        if getattr(sys, "frozen", False):
+            try:
+                from builder.static_resources import RESOURCES
+                _embedded = RESOURCES
+            except ImportError:
+                pass
+    return _embedded
+
+
+def read_resource(relative_path):
+    """
+    Returns the text of a data file. Frozen builds serve it from the embedded
+    resource bundle; otherwise (or if it was not embedded) it is read from disk.
+    Raises OSError if the file does not exist.
+    """
+    key = relative_path.replace("\\", "/")
+    embedded = _embedded_resources()
+    if key in embedded:
+        return embedded[key]
+    with open(get_data_path(relative_path), "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def load_json_resource(relative_path):
+    """Parses a JSON data file via read_resource."""
+    return json.loads(read_resource(relative_path))
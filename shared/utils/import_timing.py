@@ -0,0 +1,90 @@
+# shared/utils/import_timing.py
+"""
+Measures module import times with `python -X importtime`.
+
+The import runs in a fresh interpreter so modules already loaded by the
+caller do not hide their cost; imports done during interpreter start-up
+(site, .pth hooks) are excluded. Each result is an ImportTime(name, self_us,
+cumulative_us, depth) in microseconds; depth 0 is a top-level import.
+"""
+import os
+import sys
+import subprocess
+from collections import namedtuple
+
+from shared.utils.pycache import get_pycache_prefix
+
+START_MARKER = "-- import timing start --"
+LOADED_MARKER = "-- loaded modules: "
+
+ImportTime = namedtuple("ImportTime", ["name", "self_us", "cumulative_us", "depth"])
+
+
+def parse_importtime(stderr):
+    """Parses the `import time:` lines written by -X importtime."""
+    results = []
+    lines = stderr.splitlines()
+    if START_MARKER in lines:
+        lines = lines[lines.index(START_MARKER) + 1:]
+    for line in lines:
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            self_us = int(parts[0].strip())
+            cumulative_us = int(parts[1].strip())
+        except ValueError:
+            continue  # The header line.
+        raw_name = parts[2].rstrip()
+        name = raw_name.lstrip()
+        depth = (len(raw_name) - len(name) - 1) // 2
+        results.append(ImportTime(name, self_us, cumulative_us, max(0, depth)))
+    return results
+
+
+def run_importtime(statement, project_root, timeout=120, setup=""):
+    """
+    Runs `statement` in a fresh interpreter under -X importtime with
+    project_root on sys.path. Returns (ImportTime records, set of modules the
+    statement loaded). Modules loaded through importlib.import_module are
+    not timed by -X importtime but do appear in the loaded set.
+    `setup` runs first and neither its imports nor their times are reported,
+    so the results are the statement's cost on top of it.
+    Raises RuntimeError if the statement fails.
+    """
+    env = dict(os.environ)
+    # Same bytecode cache as the builder: keeps __pycache__ out of the tree
+    # and compile time out of all but the first measurement.
+    env["PYTHONPYCACHEPREFIX"] = get_pycache_prefix()
+    env["PYTHONPATH"] = project_root + os.pathsep + env.get("PYTHONPATH", "")
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    code = (f"{setup}\n" if setup else "") + (
+            f"import sys; _before = set(sys.modules); "
+            f"sys.stderr.write({START_MARKER!r} + '\\n'); sys.stderr.flush(); {statement}; "
+            f"sys.stderr.write({LOADED_MARKER!r} + ' '.join(sorted(set(sys.modules) - _before)) + '\\n')")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=project_root, env=env, capture_output=True, text=True, timeout=timeout
+    )
+    loaded = set()
+    other = []
+    for line in proc.stderr.splitlines():
+        if line.startswith(LOADED_MARKER):
+            loaded = set(line[len(LOADED_MARKER):].split())
+        elif not line.startswith("import time:") and line != START_MARKER:
+            other.append(line)
+    if proc.returncode != 0:
+        raise RuntimeError(f"Running `{statement}` failed:\n" + "\n".join(other[-10:]))
+    return parse_importtime(proc.stderr), loaded
+
+
+def measure_import_times(module, project_root, timeout=120):
+    """Imports `module` in a fresh interpreter and returns its ImportTime records."""
+    return run_importtime(f"import {module}", project_root, timeout)[0]
+
+
+def slowest(records, limit=30, key="cumulative_us"):
+    """Returns the `limit` records with the largest `key`."""
+    return sorted(records, key=lambda r: getattr(r, key), reverse=True)[:limit]
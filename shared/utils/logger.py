@@ -1,2 +1,207 @@
-def log_event(message):
-    print(f"[LOGGER] {message}")
+# shared/utils/logger.py
+"""
+Structured, low-overhead event logger.
+
+Records go into an in-memory ring buffer and, optionally, to a log file via a
+background writer thread. Messages use %-style arguments that are only
+formatted when a record is actually read, echoed or written, so a disabled
+logger or a filtered level costs a single comparison on hot paths.
+
+    from shared.utils import logger
+    logger.configure(enabled=True, level=logger.DEBUG, log_file="game.log")
+    logger.info("Loaded %d tasks", len(tasks), deck="tasks.json")
+    with logger.span("task_load", index=3):
+        ...
+"""
+import queue
+import threading
+import time
+from collections import deque
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+
+LEVEL_NAMES = {DEBUG: "DEBUG", INFO: "INFO", WARNING: "WARNING", ERROR: "ERROR"}
+
+# Module state. _threshold is the effective minimum level; it is set above
+# every real level when logging is disabled so the hot-path check is one compare.
+_DISABLED = ERROR + 1
+_enabled = True
+_level = INFO
+_echo_level = INFO
+_threshold = INFO
+_buffer = deque(maxlen=2000)
+_writer = None
+
+
+class LogRecord:
+    __slots__ = ("created", "level", "msg", "args", "fields")
+
+    def __init__(self, created, level, msg, args, fields):
+        self.created = created
+        self.level = level
+        self.msg = msg
+        self.args = args
+        self.fields = fields
+
+    @property
+    def message(self):
+        if self.args:
+            try:
+                return self.msg % self.args
+            except Exception:
+                return f"{self.msg} {self.args!r}"
+        return str(self.msg)
+
+    def format(self):
+        stamp = time.strftime("%H:%M:%S", time.localtime(self.created))
+        line = f"{stamp} [{LEVEL_NAMES.get(self.level, self.level)}] {self.message}"
+        if self.fields:
+            line += " " + " ".join(f"{k}={v}" for k, v in self.fields.items())
+        return line
+
+
+class _FileWriter(threading.Thread):
+    """Background thread that appends formatted records to a log file."""
+
+    def __init__(self, path):
+        super().__init__(name="logger-writer", daemon=True)
+        self.path = path
+        self.queue = queue.SimpleQueue()
+
+    def run(self):
+        with open(self.path, "a", encoding="utf-8") as f:
+            while True:
+                record = self.queue.get()
+                if record is None:
+                    break
+                f.write(record.format() + "\n")
+                if self.queue.empty():
+                    f.flush()
+
+    def stop(self):
+        self.queue.put(None)
+        self.join(timeout=2)
+
+
+def _update_threshold():
+    global _threshold
+    _threshold = min(_level, _echo_level) if _enabled else _DISABLED
+
+
+def configure(enabled=None, level=None, echo_level=None, log_file=None, buffer_size=None):
+    """
+    Adjusts logger state. Arguments left as None keep their current value.
+    Passing log_file="" stops the background file writer.
+    """
+    global _enabled, _level, _echo_level, _buffer, _writer
+    if enabled is not None:
+        _enabled = bool(enabled)
+    if level is not None:
+        _level = level
+    if echo_level is not None:
+        _echo_level = echo_level
+    if buffer_size is not None:
+        _buffer = deque(_buffer, maxlen=buffer_size)
+    if log_file is not None:
+        if _writer is not None:
+            _writer.stop()
+            _writer = None
+        if log_file:
+            _writer = _FileWriter(log_file)
+            _writer.start()
+    _update_threshold()
+
+
+def is_enabled(level=INFO):
+    return level >= _threshold
+
+
+def log(level, msg, *args, **fields):
+    if level < _threshold:
+        return
+    record = LogRecord(time.time(), level, msg, args, fields)
+    if level >= _level:
+        _buffer.append(record)
+        if _writer is not None:
+            _writer.queue.put(record)
+    if level >= _echo_level:
+        print(f"[LOGGER] {record.format()}")
+
+
+def debug(msg, *args, **fields):
+    log(DEBUG, msg, *args, **fields)
+
+
+def info(msg, *args, **fields):
+    log(INFO, msg, *args, **fields)
+
+
+def warning(msg, *args, **fields):
+    log(WARNING, msg, *args, **fields)
+
+
+def error(msg, *args, **fields):
+    log(ERROR, msg, *args, **fields)
+
+
+def log_event(msg, *args, **fields):
+    """Backwards-compatible entry point; logs at INFO."""
+    log(INFO, msg, *args, **fields)
+
+
+def get_records(level=DEBUG):
+    """Returns a snapshot of buffered records at or above level, oldest first."""
+    return [r for r in list(_buffer) if r.level >= level]
+
+
+def clear():
+    _buffer.clear()
+
+
+class _Span:
+    __slots__ = ("name", "level", "fields", "start", "elapsed")
+
+    def __init__(self, name, level, fields):
+        self.name = name
+        self.level = level
+        self.fields = fields
+        self.elapsed = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.elapsed = time.perf_counter() - self.start
+        fields = dict(self.fields, ms=round(self.elapsed * 1000, 2))
+        if exc_type is not None:
+            fields["error"] = exc_type.__name__
+        log(self.level, "span %s", self.name, **fields)
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+    elapsed = 0.0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name, level=DEBUG, **fields):
+    """
+    Context manager that logs the wall-clock duration of its block.
+    Returns a shared no-op span when the level is filtered out.
+    """
+    if level < _threshold:
+        return _NULL_SPAN
+    return _Span(name, level, fields)
@@ -0,0 +1,15 @@
+# shared/utils/pycache.py
+"""
+Location of the persistent bytecode cache used by the builder and by the
+fresh interpreters it starts (exports, import timing). See builder/cleanup.py.
+"""
+import os
+import sys
+
+PYCACHE_ENV = "NACHOCORE_PYCACHE_DIR"
+DEFAULT_PYCACHE_DIR = os.path.join(os.path.expanduser("~"), ".nachocore", "pycache")
+
+
+def get_pycache_prefix():
+    """Returns the bytecode cache directory in use (or that would be used)."""
+    return sys.pycache_prefix or os.environ.get(PYCACHE_ENV) or DEFAULT_PYCACHE_DIR
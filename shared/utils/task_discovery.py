@@ -0,0 +1,64 @@
+# shared/utils/task_discovery.py
+"""
+Finds task modules without importing them.
+
+Each task module declares `TASK_TYPE = "..."` at module level; it is read
+from the source with ast, so discovering every task type does not import
+any task module or its dependencies. A module whose TASK_TYPE is not a
+plain string literal is imported as a fallback.
+"""
+import os
+import glob
+import importlib.util
+
+from shared.utils import logger
+
+
+def normalize_task_type(task_type: str) -> str:
+    return task_type.lower().replace(" ", "_")
+
+
+def read_task_type(filepath):
+    """
+    Returns the TASK_TYPE string declared in a task module's source, or None
+    if the module does not assign it a string literal at top level.
+    """
+    import ast  # Only needed for development runs; frozen builds use the static manifest.
+    with open(filepath, "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=filepath)
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and isinstance(node.value, ast.Constant):
+            if any(isinstance(t, ast.Name) and t.id == "TASK_TYPE" for t in node.targets):
+                if isinstance(node.value.value, str):
+                    return node.value.value
+    return None
+
+
+def _import_task_type(filepath):
+    module_name = os.path.splitext(os.path.basename(filepath))[0]
+    spec = importlib.util.spec_from_file_location(module_name, filepath)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return getattr(module, "TASK_TYPE", None)
+
+
+def scan_task_modules(tasks_folder, package="shared.tasks"):
+    """
+    Returns a dict mapping normalized TASK_TYPE -> module import path for
+    every task module in tasks_folder.
+    """
+    task_modules = {}
+    for filepath in sorted(glob.glob(os.path.join(tasks_folder, "*.py"))):
+        filename = os.path.basename(filepath)
+        if filename == "__init__.py":
+            continue
+        try:
+            task_type = read_task_type(filepath)
+            if task_type is None:
+                task_type = _import_task_type(filepath)
+        except Exception as e:
+            logger.error("Error processing %s: %s", filename, e)
+            continue
+        if task_type:
+            task_modules[normalize_task_type(task_type)] = f"{package}.{os.path.splitext(filename)[0]}"
+    return task_modules